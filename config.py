@@ -47,6 +47,8 @@ TABLE_SCHEMAS = {
             {'name': 'MinimumPayment', 'type': 'decimal'},
             {'name': 'DueDate', 'type': 'date'},
         ],
+        'account_types': ['Credit Card', 'Loan', 'Line of Credit'],
+        'indexes': {'idx_debts_due_date': ['DueDate']},
         'primary_key': 'DebtID'
     },
     'Bills': {
@@ -61,6 +63,7 @@ TABLE_SCHEMAS = {
             {'name': 'EstimatedAmount', 'type': 'decimal'},
             {'name': 'DueDate', 'type': 'integer'},
         ],
+        'account_types': ['Utilities', 'Insurance', 'Subscription'],
         'primary_key': 'BillID'
     },
     'Revenue': {
@@ -99,6 +102,7 @@ TABLE_SCHEMAS = {
             {'name': 'Category', 'type': 'combo', 'source_table': 'Categories'},
             {'name': 'Notes', 'type': 'text'}
         ],
+        'indexes': {'idx_payments_date': ['PaymentDate']},
         'primary_key': 'PaymentID'
     },
     'Budget': {
@@ -123,6 +127,7 @@ TABLE_SCHEMAS = {
         ],
         'csv_columns': ['HistoryID', 'AccountID', 'DateRecorded', 'Balance'],
         'gui_fields': [],
+        'indexes': {'idx_balancehistory_account_date': ['AccountID', 'DateRecorded']},
         'primary_key': 'HistoryID'
     },
     'Goals': {
@@ -163,6 +168,19 @@ TABLE_SCHEMAS = {
     }
 }
 
+# Maps an AccountType to the detail table that stores its extra fields (from 'account_types' above)
+ACCOUNT_DETAIL_TABLES = {
+    account_type: table_name
+    for table_name, schema in TABLE_SCHEMAS.items()
+    for account_type in schema.get('account_types', [])
+}
+
+# Column name -> SQLite type per table, in schema order, so callers don't rescan 'columns' lists
+COLUMN_TYPES = {
+    table_name: {col['name']: col['type'] for col in schema['columns']}
+    for table_name, schema in TABLE_SCHEMAS.items()
+}
+
 PREDEFINED_CATEGORIES = [
     "Housing", "Utilities", "Groceries", "Transportation", "Healthcare",
     "Insurance", "Entertainment", "Shopping", "Gifts/Donations",
@@ -12,8 +12,9 @@ import logging
 import sqlite3
 import pandas as pd
 import re # Import regex for sanitization
+from concurrent.futures import ThreadPoolExecutor
 
-from config import DB_PATH, CSV_DIR, TABLE_SCHEMAS, LOG_FILE, LOG_DIR
+from config import DB_PATH, CSV_DIR, TABLE_SCHEMAS, COLUMN_TYPES, LOG_FILE, LOG_DIR
 import debt_manager_db_manager as db_manager
 
 # Ensure log directory exists
@@ -28,6 +29,15 @@ if not logging.getLogger().handlers:
                             logging.StreamHandler()
                         ])
 
+# CSV writes go through one buffered file handle; large tables are serialized in row chunks
+CSV_WRITE_BUFFER = 1 << 20
+CSV_CHUNK_ROWS = 10000
+CSV_EXPORT_WORKERS = 4 # Tables exported at once
+CSV_QUOTE_CHARS = r'[",\r\n]' # Text containing any of these must go through to_csv's quoting
+
+# One CSV file per table; the paths never change, so build them once at import
+CSV_FILE_PATHS = {table_name: os.path.join(CSV_DIR, f"{table_name}.csv") for table_name in TABLE_SCHEMAS}
+
 def sanitize_csv_string(value):
     """
     Removes characters that are problematic in CSV files or might cause issues
@@ -48,63 +58,102 @@ def sanitize_csv_string(value):
     cleaned_text = cleaned_text.strip()
 
     if original_value != cleaned_text:
-        logging.debug(f"Sanitized string: Original='{original_value[:50]}...', Cleaned='{cleaned_text[:50]}...'")
+        # Runs once per changed cell, so let logging skip the formatting when DEBUG is off
+        logging.debug("Sanitized string: Original='%s...', Cleaned='%s...'", original_value[:50], cleaned_text[:50])
 
     return cleaned_text
 
+def _format_csv_fast(df):
+    """
+    Formats a frame as CSV text with one %-format over all its cells, skipping to_csv's per-row
+    writer. Returns None when a cell would need to_csv's handling (nulls, or text needing quotes).
+    """
+    # In a single-column file an empty cell would be a blank line, which to_csv quotes as ""
+    if len(df.columns) < 2 or df.isna().values.any():
+        return None
+    for col_name in df.select_dtypes(exclude='number').columns:
+        if df[col_name].astype(str).str.contains(CSV_QUOTE_CHARS).any():
+            return None
+    # Same line terminator to_csv uses by default, so both paths write identical files
+    row_format = ','.join(['%s'] * len(df.columns)) + os.linesep
+    header = ','.join(df.columns) + os.linesep
+    # astype(object) keeps each column's own scalars (ints stay ints) instead of upcasting to a shared dtype
+    return header + (row_format * len(df)) % tuple(df.astype(object).values.ravel().tolist())
+
+def _export_table(table_name, schema):
+    """Writes one table to its CSV file. Runs on an export worker thread."""
+    csv_file_path = CSV_FILE_PATHS[table_name]
+    try:
+        # Fetch data from SQLite using db_manager's get_table_data for consistency, selecting only the
+        # exported columns the table really has, so extra/legacy columns are never read and a missing one
+        # doesn't fail the query (reindex below fills it in empty). A table with none of them (e.g. missing
+        # altogether) exports as headers only.
+        columns = db_manager.existing_columns(table_name, schema['csv_columns'])
+        df_sqlite = db_manager.get_table_data(table_name, columns) if columns else pd.DataFrame(columns=schema['csv_columns'])
+    finally:
+        # Each worker reads through its own connection; close it before the thread is reused or retired
+        db_manager.close_thread_connection()
+
+    # Ensure columns are in the order defined in 'csv_columns' and sanitize data
+    if not df_sqlite.empty:
+        # Select and reorder columns based on 'csv_columns' in one step (missing columns come back empty),
+        # then sanitize only the string columns of that narrowed frame
+        df_to_save = df_sqlite.reindex(columns=schema['csv_columns'])
+        for col_name in df_to_save.columns[df_to_save.dtypes == 'object']:
+            df_to_save[col_name] = df_to_save[col_name].apply(sanitize_csv_string)
+
+        # Save to CSV in a single serialization pass through one buffered handle; tables that fit in
+        # one chunk and need no quoting are formatted in one go, the rest go through to_csv
+        csv_text = _format_csv_fast(df_to_save) if len(df_to_save) <= CSV_CHUNK_ROWS else None
+        with open(csv_file_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as fh:
+            if csv_text is not None:
+                fh.write(csv_text)
+            else:
+                df_to_save.to_csv(fh, index=False, chunksize=CSV_CHUNK_ROWS)
+        logging.info(f"Synced data from SQLite table '{table_name}' to CSV file '{csv_file_path}'.")
+    else:
+        # If DataFrame is empty, still create an empty CSV with headers
+        empty_df = pd.DataFrame(columns=schema['csv_columns'])
+        empty_df.to_csv(csv_file_path, index=False, encoding='utf-8')
+        logging.info(f"No data for '{table_name}'. Created empty CSV file '{csv_file_path}' with headers.")
+
+def csv_is_current():
+    """
+    True if every table's CSV file was written after the database (and its WAL) last changed,
+    so a fresh sqlite_to_csv would reproduce what is already on disk.
+    """
+    if not os.path.exists(DB_PATH) or not all(os.path.exists(path) for path in CSV_FILE_PATHS.values()):
+        return False
+    db_files = [DB_PATH]
+    # Opening a connection creates (or truncates) an empty -wal without changing any data,
+    # so only a WAL that still holds frames counts as a change
+    wal_path = DB_PATH + '-wal'
+    if os.path.exists(wal_path) and os.path.getsize(wal_path) > 0:
+        db_files.append(wal_path)
+    db_mtime = max(os.path.getmtime(path) for path in db_files)
+    return min(os.path.getmtime(path) for path in CSV_FILE_PATHS.values()) > db_mtime
+
 def sqlite_to_csv():
     """
     Synchronizes data from SQLite database tables to corresponding CSV files.
     Each table is saved as a separate CSV file in the CSV_DIR.
     """
     logging.info("Starting sqlite_to_csv sync...")
-    conn = None
     try:
-        conn = sqlite3.connect(DB_PATH)
-
         # Ensure CSV directory exists
         os.makedirs(CSV_DIR, exist_ok=True)
 
-        for table_name, schema in TABLE_SCHEMAS.items():
-            csv_file_path = os.path.join(CSV_DIR, f"{table_name}.csv")
-
-            # Fetch data from SQLite using db_manager's get_table_data for consistency
-            df_sqlite = db_manager.get_table_data(table_name)
-
-            # Ensure columns are in the order defined in 'csv_columns' and sanitize data
-            if not df_sqlite.empty:
-                # Select and reorder columns based on 'csv_columns'
-                # Also, apply sanitization to all string columns
-                df_to_save = pd.DataFrame()
-                for col_name in schema['csv_columns']:
-                    if col_name in df_sqlite.columns:
-                        # Apply sanitization to string columns, convert others to string for CSV compatibility
-                        # pandas to_csv handles most types, but explicit string conversion and sanitization is safer.
-                        if df_sqlite[col_name].dtype == 'object': # Typically string columns
-                            df_to_save[col_name] = df_sqlite[col_name].apply(sanitize_csv_string)
-                        else:
-                            df_to_save[col_name] = df_sqlite[col_name]
-                    else:
-                        df_to_save[col_name] = None # Add missing columns as None
-
-                # Save to CSV
-                df_to_save.to_csv(csv_file_path, index=False, encoding='utf-8')
-                logging.info(f"Synced data from SQLite table '{table_name}' to CSV file '{csv_file_path}'.")
-            else:
-                # If DataFrame is empty, still create an empty CSV with headers
-                empty_df = pd.DataFrame(columns=schema['csv_columns'])
-                empty_df.to_csv(csv_file_path, index=False, encoding='utf-8')
-                logging.info(f"No data for '{table_name}'. Created empty CSV file '{csv_file_path}' with headers.")
+        # Tables are independent, so export them side by side: one table's SQLite read and
+        # file write (which release the GIL) overlap another's formatting
+        with ThreadPoolExecutor(max_workers=CSV_EXPORT_WORKERS, thread_name_prefix='csv-export') as pool:
+            # list() waits for every table and re-raises the first failure
+            list(pool.map(_export_table, TABLE_SCHEMAS.keys(), TABLE_SCHEMAS.values()))
 
         logging.info("sqlite_to_csv sync completed successfully.")
 
     except Exception as e:
         logging.error(f"Error during sqlite_to_csv sync: {e}", exc_info=True)
         raise # Re-raise to be caught by orchestrator
-    finally:
-        if conn:
-            conn.close()
-            logging.info("SQLite connection closed after sync.")
 
 def csv_to_sqlite():
     """
@@ -122,7 +171,7 @@ def csv_to_sqlite():
             return
 
         for table_name, schema in TABLE_SCHEMAS.items():
-            csv_file_path = os.path.join(CSV_DIR, f"{table_name}.csv")
+            csv_file_path = CSV_FILE_PATHS[table_name]
 
             if not os.path.exists(csv_file_path):
                 logging.warning(f"CSV file '{csv_file_path}' not found. Skipping sync for this table.")
@@ -135,11 +184,11 @@ def csv_to_sqlite():
             df_csv = pd.read_csv(csv_file_path, encoding='utf-8', keep_default_na=False)
 
             # Filter DataFrame to only include columns relevant to the SQLite table schema
-            sqlite_columns_expected = [col['name'] for col in schema['columns']]
+            column_types = COLUMN_TYPES[table_name]
+            sqlite_columns_expected = list(column_types)
 
             # Ensure all expected columns are in the DataFrame, add as empty string if missing
-            for col_def in schema['columns']:
-                col_name = col_def['name']
+            for col_name in column_types:
                 if col_name not in df_csv.columns:
                     df_csv[col_name] = None # Add missing columns as None
 
@@ -147,9 +196,7 @@ def csv_to_sqlite():
             df_filtered = df_csv[sqlite_columns_expected]
 
             # Type conversion based on SQLite schema before insertion
-            for col_def in schema['columns']:
-                col_name = col_def['name']
-                db_type = col_def['type']
+            for col_name, db_type in column_types.items():
                 if col_name in df_filtered.columns:
                     try:
                         if db_type == 'INTEGER':
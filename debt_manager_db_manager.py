@@ -7,10 +7,13 @@
 import sqlite3
 import pandas as pd
 from datetime import datetime
+from contextlib import contextmanager
+from functools import lru_cache
 import os
 import logging
 import json
-from config import DB_PATH, TABLE_SCHEMAS, BUDGET_CATEGORIES
+import threading
+from config import DB_PATH, TABLE_SCHEMAS, BUDGET_CATEGORIES, ACCOUNT_DETAIL_TABLES
 
 # Configure logging
 LOG_DIR = os.path.join('C:\\DebtTracker', 'Logs')
@@ -20,58 +23,190 @@ if not logging.getLogger().handlers:
     logging.basicConfig(level=logging.INFO, format='%(asctime)s: %(message)s',
                         handlers=[logging.FileHandler(LOG_FILE, mode='a'), logging.StreamHandler()])
 
+# Date format used for every TEXT date column
+ISO_DATE = "%Y-%m-%d"
+
+# Bodies of the SQL IN (...) filters, built once from config instead of on every query
+_BUDGET_CATEGORY_SQL = "','".join(BUDGET_CATEGORIES)
+_DEBT_ACCOUNT_TYPE_SQL = "','".join(TABLE_SCHEMAS['Debts']['account_types'])
+
+# Per-connection settings; WAL itself is stored in the database file by initialize_database
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",  # safe with WAL, skips an fsync on every commit
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",   # ~20 MB page cache
+    "PRAGMA mmap_size=268435456", # read pages through a 256 MB memory map instead of copying them
+)
+
+def _month_bounds(year, month):
+    """Returns ('YYYY-MM-01', first day of the next month) for a half-open date range filter."""
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return f"{year}-{month:02d}-01", f"{next_year}-{next_month:02d}-01"
+
 def get_db_connection():
     """Establishes and returns a connection to the SQLite database."""
     try:
         conn = sqlite3.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         return conn
     except sqlite3.Error as e:
         logging.critical(f"Database connection error: {e}", exc_info=True)
         raise
 
+# Bumped on every write so read caches (e.g. get_combo_options) know to re-query
+_data_version = 0
+_combo_cache = {} # {(table, value_col, display_col): (data_version, options)}
+
+def _mark_data_changed():
+    global _data_version
+    _data_version += 1
+
+def data_version():
+    """Counter that increases with every write made through this module in this process."""
+    return _data_version
+
+# Per thread: the open transaction() connection and the long-lived default one
+_tx_state = threading.local()
+
+def _thread_connection():
+    """This thread's long-lived connection, opened (and PRAGMA-configured) on first use."""
+    conn = getattr(_tx_state, 'thread_conn', None)
+    if conn is None:
+        conn = _tx_state.thread_conn = get_db_connection()
+    return conn
+
+def close_thread_connection():
+    """Closes the calling thread's long-lived connection, if it has one (e.g. at shutdown)."""
+    conn = getattr(_tx_state, 'thread_conn', None)
+    if conn is not None:
+        _tx_state.thread_conn = None
+        conn.close()
+
+@contextmanager
+def transaction():
+    """
+    Runs every write issued inside the block (including via execute_query and the
+    add_/update_ helpers) in one BEGIN IMMEDIATE ... COMMIT, so the whole unit costs
+    a single commit. Rolls back if anything raises, and re-raises, so a failed write inside
+    the block reaches the caller as an exception. Nested blocks join the outer one.
+    """
+    if getattr(_tx_state, 'conn', None) is not None:
+        yield _tx_state.conn
+        return
+
+    conn = get_db_connection()
+    conn.isolation_level = None # Manual transaction control
+    conn.execute("BEGIN IMMEDIATE")
+    _tx_state.conn = conn
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        _tx_state.conn = None
+        conn.close()
+        # Caches filled during the block may hold its uncommitted rows (gone after a rollback),
+        # or, on other threads, rows from before it committed; either way they must re-query
+        _mark_data_changed()
+
 def execute_query(query, params=None, fetch=None, commit=False):
-    """A generic function to execute any SQL query."""
+    """
+    A generic function to execute any SQL query. On a database error it logs and returns None,
+    except inside transaction(), where it re-raises so the whole block rolls back.
+    """
+    tx_conn = getattr(_tx_state, 'conn', None)
     conn = None
     try:
-        conn = get_db_connection()
+        # Outside transaction() every query reuses this thread's connection instead of opening one
+        conn = tx_conn or _thread_connection()
         cursor = conn.cursor()
         cursor.execute(query, params if params else ())
 
         if commit:
-            conn.commit()
-            last_id = cursor.lastrowid
-            conn.close() # Close after commit
-            return last_id
-
-        if fetch == 'one':
+            _mark_data_changed()
+            # Inside transaction() the commit happens once at the end of the block
+            if tx_conn is None:
+                conn.commit()
+            result = cursor.lastrowid
+        elif fetch == 'one':
             result = cursor.fetchone()
-            conn.close()
-            return result
-        if fetch == 'all':
+        elif fetch == 'all':
             result = cursor.fetchall()
-            conn.close()
-            return result
+        else:
+            # If no commit or fetch, assume the caller will handle it
+            return cursor
 
-        # If no commit or fetch, assume the caller will handle it
-        return cursor
+        return result
     except sqlite3.Error as e:
         logging.error(f"Error executing query: {query} with params {params}: {e}", exc_info=True)
+        if tx_conn is not None:
+            raise # Let transaction() roll back the whole unit
         if conn:
-            conn.close()
+            # The connection outlives this call; don't leave a failed write's implicit transaction open
+            conn.rollback()
         return None
 
 
-def get_table_data(table_name):
-    """Fetches all data from a specified table and returns a pandas DataFrame."""
+def query_rows(query, params=None):
+    """Runs a read query and returns plain tuples, for small results that don't need a DataFrame."""
+    rows = execute_query(query, params, fetch='all')
+    return [tuple(row) for row in rows] if rows else []
+
+def get_combo_options(table_name, value_col, display_col):
+    """
+    Returns (value, display) tuples for a picker, without building a DataFrame of the whole table.
+    Results are reused until the next write through this module.
+    """
+    key = (table_name, value_col, display_col)
+    entry = _combo_cache.get(key)
+    if entry and entry[0] == _data_version:
+        return entry[1]
+    version = _data_version
+    options = query_rows(f"SELECT {value_col}, {display_col} FROM {table_name}")
+    _combo_cache[key] = (version, options)
+    return options
+
+def get_category_map():
+    """Returns {CategoryName: CategoryID}, served from the combo cache until the next write."""
+    return {name: category_id for category_id, name in get_combo_options('Categories', 'CategoryID', 'CategoryName')}
+
+def get_table_data(table_name, columns=None):
+    """
+    Fetches all data (or just the given columns) from a specified table and returns a pandas DataFrame.
+    An empty column list (e.g. from existing_columns on a missing table) means no data.
+    """
+    if columns is not None and not columns:
+        return pd.DataFrame()
     try:
-        with get_db_connection() as conn:
-            df = pd.read_sql_query(f"SELECT * FROM {table_name}", conn)
-            return df
+        conn = getattr(_tx_state, 'conn', None) or _thread_connection()
+        select = ', '.join(columns) if columns else '*'
+        return pd.read_sql_query(f"SELECT {select} FROM {table_name}", conn)
     except (sqlite3.Error, pd.io.sql.DatabaseError) as e:
         logging.error(f"Error loading table data for {table_name}: {e}", exc_info=True)
         return pd.DataFrame()
 
+def existing_columns(table_name, columns):
+    """
+    Returns the given columns that the table actually has, in the given order. An older database
+    can lack a schema column (db_init can't add NOT NULL ones without a default).
+    """
+    present = {row['name'] for row in execute_query(f"PRAGMA table_info({table_name})", fetch='all') or ()}
+    return [col for col in columns if col in present]
+
+def get_table_rows(table_name, columns):
+    """Fetches just the given columns of every row as plain tuples, for callers that don't need a DataFrame."""
+    if not columns:
+        return []
+    return query_rows(f"SELECT {', '.join(columns)} FROM {table_name}")
+
+def table_is_empty(table_name):
+    """True if the table has no rows; reads at most one row instead of loading the table."""
+    return not query_rows(f"SELECT 1 FROM {table_name} LIMIT 1")
+
 def get_record_by_id(table_name, record_id):
     """Fetches a single record by its primary key."""
     pk_column = TABLE_SCHEMAS[table_name]['primary_key']
@@ -79,38 +214,55 @@ def get_record_by_id(table_name, record_id):
     data = execute_query(query, (record_id,), fetch='one')
     return dict(data) if data else None
 
+@lru_cache(maxsize=256)
+def _insert_sql(table_name, columns):
+    """Builds (once per table/column set) the INSERT statement used by add_record."""
+    placeholders = ', '.join(['?'] * len(columns))
+    return f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+
+@lru_cache(maxsize=256)
+def _update_sql(table_name, columns):
+    """Builds (once per table/column set) the UPDATE statement used by update_record."""
+    pk_column = TABLE_SCHEMAS[table_name]['primary_key']
+    set_clause = ', '.join([f"{key} = ?" for key in columns])
+    return f"UPDATE {table_name} SET {set_clause} WHERE {pk_column} = ?"
+
 def add_record(table_name, data_dict):
     """Adds a new record to a table."""
-    columns = ', '.join(data_dict.keys())
-    placeholders = ', '.join(['?' for _ in data_dict])
-    query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+    query = _insert_sql(table_name, tuple(data_dict))
     return execute_query(query, tuple(data_dict.values()), commit=True)
 
 def update_record(table_name, record_id, data_dict):
     """Updates an existing record in a table."""
-    pk_column = TABLE_SCHEMAS[table_name]['primary_key']
-    set_clause = ', '.join([f"{key} = ?" for key in data_dict])
-    query = f"UPDATE {table_name} SET {set_clause} WHERE {pk_column} = ?"
+    query = _update_sql(table_name, tuple(data_dict))
     params = tuple(data_dict.values()) + (record_id,)
     execute_query(query, params, commit=True)
 
 
 # --- GUI Data Retrieval Functions ---
 
-def get_full_debt_details():
+def get_full_debt_details(debt_id=None):
     query = """
     SELECT d.DebtID, a.AccountName, d.InterestRate, d.MinimumPayment, d.DueDate, a.Balance
     FROM Debts d JOIN Accounts a ON d.AccountID = a.AccountID
     """
-    data = execute_query(query, fetch='all')
+    params = None
+    if debt_id is not None:
+        query += " WHERE d.DebtID = ?"
+        params = (debt_id,)
+    data = execute_query(query, params, fetch='all')
     return pd.DataFrame(data, columns=['DebtID', 'AccountName', 'InterestRate', 'MinimumPayment', 'DueDate', 'Balance']) if data else pd.DataFrame()
 
-def get_full_bill_details():
+def get_full_bill_details(bill_id=None):
     query = """
     SELECT b.BillID, a.AccountName, b.EstimatedAmount, b.DueDate
     FROM Bills b JOIN Accounts a ON b.AccountID = a.AccountID
     """
-    data = execute_query(query, fetch='all')
+    params = None
+    if bill_id is not None:
+        query += " WHERE b.BillID = ?"
+        params = (bill_id,)
+    data = execute_query(query, params, fetch='all')
     return pd.DataFrame(data, columns=['BillID', 'AccountName', 'EstimatedAmount', 'DueDate']) if data else pd.DataFrame()
 
 def get_upcoming_items():
@@ -121,8 +273,8 @@ def get_upcoming_items():
     ORDER BY Date
     LIMIT 10;
     """
-    data = execute_query(query, fetch='all')
-    return pd.DataFrame(data, columns=['Date', 'Item', 'Amount']) if data else pd.DataFrame()
+    # At most 10 rows for the dashboard: (Date, Item, Amount) tuples, no DataFrame needed
+    return query_rows(query)
 
 def get_goal_progress():
     query = """
@@ -135,41 +287,44 @@ def get_goal_progress():
     data = execute_query(query, fetch='all')
     return pd.DataFrame(data, columns=['GoalName', 'TargetAmount', 'CurrentAmount']) if data else pd.DataFrame()
 
-def get_spending_by_category(year=datetime.now().year, month=datetime.now().month):
+def get_spending_by_category(year=None, month=None):
+    """Spending per budget category for the given month (defaults to the current one)."""
+    if year is None or month is None:
+        today = datetime.now()
+        year, month = today.year, today.month
     query = """
     SELECT c.CategoryName, SUM(p.Amount) as TotalAmount
     FROM Payments p
     JOIN Categories c ON p.CategoryID = c.CategoryID
-    WHERE CAST(strftime('%Y', p.PaymentDate) AS INTEGER) = ?
-      AND CAST(strftime('%m', p.PaymentDate) AS INTEGER) = ?
+    WHERE p.PaymentDate >= ? AND p.PaymentDate < ?
       AND c.CategoryName IN ('{}')
     GROUP BY c.CategoryName
     HAVING TotalAmount > 0
-    """.format("','".join(BUDGET_CATEGORIES))
-    data = execute_query(query, (year, month), fetch='all')
+    """.format(_BUDGET_CATEGORY_SQL)
+    data = execute_query(query, _month_bounds(year, month), fetch='all')
     return pd.DataFrame(data, columns=['CategoryName', 'TotalAmount']) if data else pd.DataFrame()
 
 def get_debt_distribution():
     query = """
     SELECT AccountName, ABS(Balance) as AbsoluteBalance
     FROM Accounts
-    WHERE AccountType IN ('Credit Card', 'Loan', 'Line of Credit') AND Balance < 0
-    """
+    WHERE AccountType IN ('{}') AND Balance < 0
+    """.format(_DEBT_ACCOUNT_TYPE_SQL)
     data = execute_query(query, fetch='all')
     return pd.DataFrame(data, columns=['AccountName', 'AbsoluteBalance']) if data else pd.DataFrame()
 
 def get_calendar_events(year, month):
-    query_debts = "SELECT DueDate, AccountName FROM Debts JOIN Accounts ON Debts.AccountID = Accounts.AccountID WHERE strftime('%Y-%m', DueDate) = ?"
+    # A plain range on DueDate (rather than strftime() on it) lets SQLite use idx_debts_due_date
+    query_debts = "SELECT DueDate, AccountName FROM Debts JOIN Accounts ON Debts.AccountID = Accounts.AccountID WHERE DueDate >= ? AND DueDate < ?"
     query_bills = "SELECT DueDate, AccountName FROM Bills JOIN Accounts ON Bills.AccountID = Accounts.AccountID"
 
-    month_str = f"{year}-{str(month).zfill(2)}"
-    debts = execute_query(query_debts, (month_str,), fetch='all')
+    debts = execute_query(query_debts, _month_bounds(year, month), fetch='all')
     bills = execute_query(query_bills, fetch='all')
 
     events = {}
     if debts:
         for row in debts:
-            day = int(row['DueDate'].split('-')[2])
+            day = int(row['DueDate'].rpartition('-')[2])
             if day not in events: events[day] = []
             events[day].append(row['AccountName'])
     if bills:
@@ -190,13 +345,12 @@ def get_budget_summary(year, month):
     LEFT JOIN (
         SELECT CategoryID, SUM(Amount) as ActualAmount
         FROM Payments
-        WHERE CAST(strftime('%Y', PaymentDate) AS INTEGER) = ?
-          AND CAST(strftime('%m', PaymentDate) AS INTEGER) = ?
+        WHERE PaymentDate >= ? AND PaymentDate < ?
         GROUP BY CategoryID
     ) p_sum ON c.CategoryID = p_sum.CategoryID
     WHERE c.CategoryName IN ('{}')
-    """.format("','".join(BUDGET_CATEGORIES))
-    data = execute_query(query, (year, month), fetch='all')
+    """.format(_BUDGET_CATEGORY_SQL)
+    data = execute_query(query, _month_bounds(year, month), fetch='all')
     return pd.DataFrame(data, columns=['Category', 'Allocated', 'Actual']) if data else pd.DataFrame()
 
 def get_balance_history_for_account(account_name):
@@ -211,7 +365,7 @@ def get_balance_history_for_account(account_name):
     return pd.DataFrame(data, columns=['DateRecorded', 'Balance']) if data else pd.DataFrame()
 
 def get_budget_categories():
-    query = "SELECT CategoryID, CategoryName FROM Categories WHERE CategoryName IN ('{}')".format("','".join(BUDGET_CATEGORIES))
+    query = "SELECT CategoryID, CategoryName FROM Categories WHERE CategoryName IN ('{}')".format(_BUDGET_CATEGORY_SQL)
     data = execute_query(query, fetch='all')
     return pd.DataFrame(data, columns=['CategoryID', 'CategoryName']) if data else pd.DataFrame()
 
@@ -223,15 +377,13 @@ def get_all_budgets():
 # --- Data Modification Functions ---
 
 def add_account_and_details(account_data, detail_data=None):
-    account_id = add_record('Accounts', account_data)
-    if not account_id: return None
-
-    account_type = account_data.get('AccountType')
-    detail_data['AccountID'] = account_id
-    if account_type in ['Credit Card', 'Loan', 'Line of Credit'] and detail_data:
-        add_record('Debts', detail_data)
-    elif account_type in ['Utilities', 'Insurance', 'Subscription'] and detail_data:
-        add_record('Bills', detail_data)
+    """Adds an account and its Debts/Bills row in one transaction. Raises sqlite3.Error on failure."""
+    with transaction():
+        account_id = add_record('Accounts', account_data)
+        detail_table = ACCOUNT_DETAIL_TABLES.get(account_data.get('AccountType'))
+        if detail_table:
+            # Omitted detail columns fall back to the schema's column defaults
+            add_record(detail_table, {**(detail_data or {}), 'AccountID': account_id})
     return account_id
 
 def update_debt_details(debt_id, detail_data):
@@ -240,42 +392,63 @@ def update_debt_details(debt_id, detail_data):
 def update_bill_details(bill_id, detail_data):
     update_record('Bills', bill_id, detail_data)
 
+def _link_goal_accounts(conn, goal_id, linked_account_ids):
+    """Inserts all GoalAccountLinks rows for a goal with one executemany on the transaction's connection."""
+    conn.executemany("INSERT INTO GoalAccountLinks (GoalID, AccountID) VALUES (?, ?)",
+                     [(goal_id, acc_id) for acc_id in linked_account_ids])
+
 def add_goal(goal_data, linked_account_ids):
-    goal_id = add_record('Goals', goal_data)
-    if goal_id and linked_account_ids:
-        for acc_id in linked_account_ids:
-            execute_query("INSERT INTO GoalAccountLinks (GoalID, AccountID) VALUES (?, ?)", (goal_id, acc_id), commit=True)
+    """Adds a goal and its account links in one transaction. Raises sqlite3.Error on failure."""
+    with transaction() as conn:
+        goal_id = add_record('Goals', goal_data)
+        if linked_account_ids:
+            _link_goal_accounts(conn, goal_id, linked_account_ids)
+    return goal_id
 
 def update_goal(goal_id, goal_data, linked_account_ids):
-    update_record('Goals', goal_id, goal_data)
-    # Reset links and add new ones
-    execute_query("DELETE FROM GoalAccountLinks WHERE GoalID = ?", (goal_id,), commit=True)
-    if linked_account_ids:
-        for acc_id in linked_account_ids:
-            execute_query("INSERT INTO GoalAccountLinks (GoalID, AccountID) VALUES (?, ?)", (goal_id, acc_id), commit=True)
+    """Updates a goal and replaces its account links in one transaction. Raises sqlite3.Error on failure."""
+    with transaction() as conn:
+        update_record('Goals', goal_id, goal_data)
+        # Reset links and add new ones
+        execute_query("DELETE FROM GoalAccountLinks WHERE GoalID = ?", (goal_id,), commit=True)
+        if linked_account_ids:
+            _link_goal_accounts(conn, goal_id, linked_account_ids)
 
 def get_linked_accounts_for_goal(goal_id):
     data = execute_query("SELECT AccountID FROM GoalAccountLinks WHERE GoalID = ?", (goal_id,), fetch='all')
     return [row['AccountID'] for row in data] if data else []
 
 def record_all_account_balances():
-    accounts = get_table_data('Accounts')
-    if accounts.empty: return
-    today = datetime.now().strftime("%Y-%m-%d")
-    for _, row in accounts.iterrows():
-        if row['Status'] == 'Active':
-            # Check if a record for today already exists
-            exists = execute_query("SELECT 1 FROM BalanceHistory WHERE AccountID = ? AND DateRecorded = ?", (row['AccountID'], today), fetch='one')
-            if exists:
-                 # Update existing record for today
-                execute_query("UPDATE BalanceHistory SET Balance = ? WHERE AccountID = ? AND DateRecorded = ?", (row['Balance'], row['AccountID'], today), commit=True)
-            else:
-                 # Insert new record
-                execute_query("INSERT INTO BalanceHistory (AccountID, DateRecorded, Balance) VALUES (?, ?, ?)", (row['AccountID'], today, row['Balance']), commit=True)
-
-def set_budget_for_category(category_id, allocated_amount):
-    exists = execute_query("SELECT BudgetID FROM Budget WHERE CategoryID = ?", (category_id,), fetch='one')
-    if exists:
-        execute_query("UPDATE Budget SET AllocatedAmount = ? WHERE CategoryID = ?", (allocated_amount, category_id), commit=True)
-    else:
-        execute_query("INSERT INTO Budget (CategoryID, AllocatedAmount) VALUES (?, ?)", (category_id, allocated_amount), commit=True)
\ No newline at end of file
+    """Snapshots today's balance for every active account using one bulk UPDATE and one bulk INSERT."""
+    today = datetime.now().strftime(ISO_DATE)
+    conn = get_db_connection()
+    try:
+        with conn:
+            active = conn.execute("SELECT AccountID, Balance FROM Accounts WHERE Status = 'Active'").fetchall()
+            if not active: return
+            # Accounts that already have a record for today get updated, the rest inserted
+            recorded = {row['AccountID'] for row in conn.execute("SELECT AccountID FROM BalanceHistory WHERE DateRecorded = ?", (today,))}
+            updates = [(row['Balance'], row['AccountID'], today) for row in active if row['AccountID'] in recorded]
+            inserts = [(row['AccountID'], today, row['Balance']) for row in active if row['AccountID'] not in recorded]
+            if updates:
+                conn.executemany("UPDATE BalanceHistory SET Balance = ? WHERE AccountID = ? AND DateRecorded = ?", updates)
+            if inserts:
+                conn.executemany("INSERT INTO BalanceHistory (AccountID, DateRecorded, Balance) VALUES (?, ?, ?)", inserts)
+            _mark_data_changed()
+    finally:
+        conn.close()
+
+def set_budgets_bulk(budgets):
+    """Sets AllocatedAmount for many categories at once from (CategoryID, amount) pairs, in one transaction."""
+    if not budgets:
+        return
+    with transaction() as conn:
+        # Categories that already have a budget row get updated, the rest inserted
+        existing = {row['CategoryID'] for row in conn.execute("SELECT CategoryID FROM Budget")}
+        updates = [(amount, cat_id) for cat_id, amount in budgets if cat_id in existing]
+        inserts = [(cat_id, amount) for cat_id, amount in budgets if cat_id not in existing]
+        if updates:
+            conn.executemany("UPDATE Budget SET AllocatedAmount = ? WHERE CategoryID = ?", updates)
+        if inserts:
+            conn.executemany("INSERT INTO Budget (CategoryID, AllocatedAmount) VALUES (?, ?)", inserts)
+        _mark_data_changed()
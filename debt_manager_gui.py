@@ -8,19 +8,23 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, date
 import calendar
 import os
+import re
 import logging
+import logging.handlers
+import queue
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.dates as mdates
 
 import debt_manager_db_manager as db_manager
-from config import TABLE_SCHEMAS, BASE_DIR
-from debt_manager_csv_sync import sqlite_to_csv
+from config import TABLE_SCHEMAS, COLUMN_TYPES, CSV_DIR
+from debt_manager_csv_sync import sqlite_to_csv, csv_is_current
 
 # Configure logging
 LOG_DIR = os.path.join('C:\\DebtTracker', 'Logs')
@@ -34,6 +38,139 @@ if not logging.getLogger().handlers:
                             logging.StreamHandler()
                         ])
 
+def _start_log_listener():
+    """
+    Moves the root logger's handlers (log file + console) behind a QueueHandler, so logging from the
+    Tk thread only enqueues the record and a listener thread does the disk writes. Returns the listener.
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    for handler in handlers:
+        root.removeHandler(handler)
+    log_queue = queue.Queue(-1)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+# How often (ms) the Tk loop checks on work handed to the background pools
+BACKGROUND_POLL_MS = 50
+
+# Read-only queries for the tabs run side by side (SQLite in WAL mode allows concurrent readers)
+QUERY_WORKERS = 4
+
+# Quiet period (ms) after the last save before the affected views are reloaded
+VIEW_REFRESH_DELAY_MS = 200
+
+# Which table tabs get Add / Edit buttons, and which edit through the account-details form
+ADDABLE_TABLES = frozenset({'Accounts', 'Payments', 'Goals', 'Revenue'})
+EDITABLE_TABLES = frozenset({'Accounts', 'Payments', 'Debts', 'Bills', 'Goals', 'Revenue'})
+DETAIL_FORM_TABLES = frozenset({'Debts', 'Bills'})
+
+# Detail-form fields each summary view displays; edits to other fields (e.g. InterestRate) leave them as-is
+DETAIL_VIEW_FIELDS = {
+    'Debts': {'Dashboard': {'DueDate', 'MinimumPayment'}, 'Calendar': {'DueDate'}},
+    'Bills': {'Dashboard': {'DueDate', 'EstimatedAmount'}, 'Calendar': {'DueDate'}},
+}
+
+# Revenue form entries; allocations get their own per-account frame
+REVENUE_FORM_FIELDS = [f for f in TABLE_SCHEMAS['Revenue']['gui_fields'] if f['type'] != 'allocations']
+
+# Tabs whose treeview shows joined data instead of the raw table, resolved once at import
+TABLE_FETCHERS = {
+    'Debts': db_manager.get_full_debt_details,
+    'Bills': db_manager.get_full_bill_details,
+}
+
+# Cheap shape check so only well-formed strings reach date.fromisoformat (much faster than strptime)
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+def _is_valid_date(value):
+    """Returns True if value is a real calendar date in YYYY-MM-DD format."""
+    if not _DATE_RE.match(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+# Numeric shape checks let the happy path skip float()/int() exception handling
+_NUM_RE = re.compile(r'^-?(?:\d+(?:\.\d*)?|\.\d+)$')
+_INT_RE = re.compile(r'^-?\d+$')
+
+def _read_entries(entries):
+    """Reads every Entry in a {key: widget} dict in one pass, trimming surrounding whitespace."""
+    return {key: entry.get().strip() for key, entry in entries.items()}
+
+def _clear_tree(tree):
+    """Removes every row from a Treeview with one Tcl call instead of one per item."""
+    children = tree.get_children()
+    if children:
+        tree.delete(*children)
+
+_format_money = '${:,.2f}'.format
+
+def _currency_column(series):
+    """Formats a numeric Series as '$1,234.56' strings in one pandas pass."""
+    return series.map(_format_money)
+
+def _fetch_table_rows(table_name):
+    """
+    Queries a table tab's data on the worker pool and returns (columns, {iid: row tuple}),
+    keyed by primary key. Only plain tuples go back to the Tk thread.
+    """
+    pk_column = TABLE_SCHEMAS[table_name]['primary_key']
+    fetcher = TABLE_FETCHERS.get(table_name)
+    if fetcher is None:
+        # Plain tables skip pandas entirely: the schema's columns come back from SQLite as tuples,
+        # with the same native values get_record_by_id gives _refresh_tree_row. Only columns the
+        # database really has are selected, so one missing column doesn't empty the whole tab.
+        columns = tuple(db_manager.existing_columns(table_name, COLUMN_TYPES[table_name]))
+        if pk_column not in columns:
+            return (), {} # The table is missing (no columns at all); show an empty tab
+        pk_index = columns.index(pk_column)
+        return columns, {str(row[pk_index]): row for row in db_manager.get_table_rows(table_name, columns)}
+
+    # Tabs that need joined data have their own query; the DataFrame is dropped here
+    df = fetcher()
+    if df.empty:
+        return (), {}
+    columns = tuple(df.columns)
+    # Convert column by column (tolist() also yields native Python values), then zip into rows
+    column_values = [df[col].tolist() for col in columns]
+    pk_values = column_values[columns.index(pk_column)]
+    return columns, dict(zip(map(str, pk_values), zip(*column_values)))
+
+def _fetch_balance_history(account_name):
+    """Loads one account's balance history with parsed dates; runs on the worker pool."""
+    history_df = db_manager.get_balance_history_for_account(account_name)
+    if not history_df.empty:
+        history_df['DateRecorded'] = pd.to_datetime(history_df['DateRecorded'])
+    return history_df
+
+def _fetch_dashboard_data():
+    """Runs every dashboard query; called on the worker pool so SQLite I/O stays off the Tk thread."""
+    return (db_manager.get_upcoming_items(), db_manager.get_goal_progress(),
+            db_manager.get_spending_by_category(), db_manager.get_debt_distribution())
+
+def _startup_csv_version():
+    """
+    The data version the CSV files reflect at startup: the current one if they are newer than the
+    database (e.g. just synced by the orchestrator), otherwise None.
+    """
+    return db_manager.data_version() if csv_is_current() else None
+
+def _prepare_database():
+    """Ensures the database exists, seeding sample data on a first run for a good first experience."""
+    from debt_manager_db_init import initialize_database
+
+    initialize_database()
+    if db_manager.table_is_empty('Accounts'):
+        # Only a first run needs the seeding module
+        from debt_manager_sample_data import populate_with_sample_data
+        populate_with_sample_data()
+
 class DebtManagerApp(tk.Tk):
     """Main application class for the Debt Management System GUI."""
 
@@ -44,7 +181,19 @@ class DebtManagerApp(tk.Tk):
         self.style = ttk.Style(self)
         self.style.theme_use('clam')
 
-        self.current_calendar_date = datetime.now()
+        self.current_calendar_date = date.today().replace(day=1) # only the year and month are used
+        self._pending_view_refresh = set() # Views queued for the next debounced refresh
+        self._view_refresh_handle = None
+        self._stale_tabs = set() # Tabs whose data may be outdated; each reloads when next selected
+        self._latest_request = {} # {view key: sequence number of its newest background load}
+        # db_manager.data_version() the CSV files reflect; None forces a sync on close
+        self._csv_synced_version = _startup_csv_version()
+        self._closing = False # Set once the user confirmed quitting
+        self._history_cache = {} # {account_name: balance history DataFrame with parsed dates}
+        # Tab queries run on _query_pool; slow file I/O (CSV export) is serialized on _io_pool.
+        # Both keep the Tk main loop servicing events.
+        self._query_pool = ThreadPoolExecutor(max_workers=QUERY_WORKERS)
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
         self.create_widgets()
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.load_all_data()
@@ -75,67 +224,181 @@ class DebtManagerApp(tk.Tk):
 
 
     def load_all_data(self):
-        """Refreshes the data across the entire application."""
-        logging.info("Refreshing all application data...")
-        self._load_dashboard_data()
-        self._populate_calendar()
-        self._load_budget_data()
-
-        for table_name in self.tabs:
-            if 'tree' in self.tabs[table_name]:
-                self._load_specific_table_data(table_name)
-
-        if 'Analytics' in self.tabs:
+        """
+        Refreshes the data across the entire application.
+        Only the tab on screen is reloaded now; the others are marked stale and reload when next shown.
+        """
+        logging.debug("Refreshing all application data...") # Runs on every Refresh click; keep it out of the INFO log
+        self._invalidate_cache()
+        current_tab = self._current_tab()
+        self._stale_tabs = set(self.tabs) - {current_tab}
+        self._load_tab(current_tab)
+
+    def _current_tab(self):
+        return self.notebook.tab(self.notebook.select(), "text")
+
+    def _load_tab(self, tab_name):
+        """Loads whatever tab_name displays and clears its stale mark."""
+        self._stale_tabs.discard(tab_name)
+        if tab_name == "Dashboard":
+            self._load_dashboard_data()
+        elif tab_name == "Calendar":
+            self._populate_calendar()
+        elif tab_name == "Budget":
+            self._load_budget_data()
+        elif tab_name == "Analytics":
             self.populate_analytics_account_dropdown()
-        logging.info("All data refreshed.")
-
-    def _load_specific_table_data(self, table_name):
-        """Helper to load data for a specific tab's treeview."""
+            self._display_balance_history()
+        elif 'tree' in self.tabs.get(tab_name, {}):
+            self._load_specific_table_data(tab_name)
+
+    def _load_specific_table_data(self, table_name, changed_pks=None):
+        """
+        Helper to load data for a specific tab's treeview.
+        When changed_pks is given, only those rows are re-fetched and patched in place.
+        """
         if table_name not in self.tabs or 'tree' not in self.tabs[table_name]:
             return
 
-        tree = self.tabs[table_name]['tree']
-        for i in tree.get_children():
-            tree.delete(i)
+        tab = self.tabs[table_name]
+        tree = tab['tree']
+        # Patching rows is only safe when no full reload is about to replace them
+        if changed_pks is not None and tree.get_children() and not tab.get('pending_load'):
+            for pk in changed_pks:
+                self._refresh_tree_row(table_name, pk)
+            return
+
+        # Query on the worker pool; a later request for the same tab supersedes this one
+        token = tab['pending_load'] = tab.get('load_seq', 0) + 1
+        tab['load_seq'] = token
 
-        df = pd.DataFrame()
+        def on_done(future):
+            if tab.get('pending_load') != token:
+                return
+            tab['pending_load'] = None
+            try:
+                table_rows = future.result()
+            except Exception as e:
+                logging.error(f"Error loading data for {table_name}: {e}", exc_info=True)
+                return
+            self._fill_table_tree(table_name, table_rows)
+
+        self._run_in_background(_fetch_table_rows, on_done, table_name)
+
+    def _fill_table_tree(self, table_name, table_rows):
+        """
+        Brings a table tab's rows in line with (columns, rows) from _fetch_table_rows (Tk thread only).
+        Only rows that were added, removed or changed since the last load touch the Treeview;
+        tab['rows'] remembers what is shown.
+        """
+        tab = self.tabs[table_name]
+        tree = tab['tree']
+        columns, new_rows = table_rows
         try:
-            # Special handlers for tabs that need joined data
-            if table_name == 'Debts':
-                df = db_manager.get_full_debt_details()
-            elif table_name == 'Bills':
-                df = db_manager.get_full_bill_details()
-            else:
-                df = db_manager.get_table_data(table_name)
-
-            if not df.empty:
-                tree['columns'] = df.columns.tolist()
-                tree.column("#0", width=0, stretch=tk.NO)
-                for col in df.columns:
-                    tree.heading(col, text=col, command=lambda c=col: self._sort_treeview(table_name, c, False))
-                    tree.column(col, anchor=tk.W, width=120)
-                for _, row in df.iterrows():
-                    tree.insert("", "end", values=row.tolist())
+            if not new_rows:
+                _clear_tree(tree)
+                tab['rows'] = {}
+                return
+            # Headings are laid out when the tab is built; redo them only if the query's columns differ
+            if tab.get('columns') != columns:
+                self._set_tree_columns(table_name, columns)
+                _clear_tree(tree)
+                tab['rows'] = {}
+
+            old_rows = tab.get('rows', {})
+            if new_rows == old_rows:
+                return
+
+            removed = [item for item in old_rows if item not in new_rows]
+            if removed:
+                tree.delete(*removed)
+            # Talk to the Tcl widget directly: ttk's insert()/item() re-format the option dict
+            # in Python for every row, which dominates the cost of filling a large table
+            tcl_call, path = tree.tk.call, str(tree)
+            for item, values in new_rows.items():
+                old_values = old_rows.get(item)
+                if old_values is None:
+                    tcl_call(path, 'insert', '', 'end', '-id', item, '-values', values)
+                elif old_values != values:
+                    tcl_call(path, 'item', item, '-values', values)
+            tab['rows'] = new_rows
         except Exception as e:
             logging.error(f"Error loading data for {table_name}: {e}", exc_info=True)
+            # Start from an empty tree next time rather than diff against a half-applied update
+            _clear_tree(tree)
+            tab['rows'] = {}
+
+    def _set_tree_columns(self, table_name, columns):
+        """Lays out a table tab's columns and sortable headings, and records them in tab['columns']."""
+        tree = self.tabs[table_name]['tree']
+        tree['columns'] = columns
+        tree.column("#0", width=0, stretch=tk.NO)
+        for col in columns:
+            tree.heading(col, text=col, command=lambda c=col: self._sort_treeview(table_name, c, False))
+            tree.column(col, anchor=tk.W, width=120)
+        self.tabs[table_name]['columns'] = columns
+
+    def _invalidate_cache(self):
+        """Drops the cached balance histories after a refresh or a write to BalanceHistory."""
+        self._history_cache.clear()
+        # A history query already in flight would put pre-write data back into the cache; drop its result
+        self._latest_request['History'] = self._latest_request.get('History', 0) + 1
 
     def _sort_treeview(self, table_name, col, reverse):
         """Sorts the treeview columns when a header is clicked."""
-        tree = self.tabs[table_name]['tree']
-        data = [(tree.set(child, col), child) for child in tree.get_children('')]
+        tab = self.tabs[table_name]
+        tree = tab['tree']
+        # Sort the values tab['rows'] already holds instead of asking Tcl for every cell
+        col_index = tab['columns'].index(col)
+        data = [(values[col_index], item) for item, values in tab.get('rows', {}).items()]
 
         try:
-            # Attempt to sort numerically, converting to string and cleaning first
-            data.sort(key=lambda t: float(str(t[0]).replace('$', '').replace(',', '')), reverse=reverse)
+            if all(isinstance(value, (int, float)) for value, _ in data):
+                # tab['rows'] holds the raw query values, so numeric columns need no parsing
+                data.sort(key=lambda t: t[0], reverse=reverse)
+            else:
+                # Attempt to sort numerically, converting to string and cleaning first
+                data.sort(key=lambda t: float(str(t[0]).replace('$', '').replace(',', '')), reverse=reverse)
         except (ValueError, TypeError):
             # Fallback to string sort if numerical conversion fails
             data.sort(key=lambda t: str(t[0]), reverse=reverse)
 
-        for index, (val, child) in enumerate(data):
-            tree.move(child, '', index)
+        # Reorder every row with one Tcl call rather than one move per row
+        tree.set_children('', *[item for _, item in data])
 
         tree.heading(col, command=lambda: self._sort_treeview(table_name, col, not reverse))
 
+    def _selected_record_id(self, table_name):
+        """Returns the primary key of the selected row, or None if nothing is selected."""
+        selection = self.tabs[table_name]['tree'].selection()
+        return int(selection[0]) if selection else None
+
+    def _refresh_tree_row(self, table_name, record_id):
+        """Updates (or appends) a single treeview row in place instead of reloading the whole table."""
+        tree = self.tabs[table_name]['tree']
+        columns = self.tabs[table_name].get('columns', ())
+        record = None
+        if record_id:
+            fetcher = TABLE_FETCHERS.get(table_name)
+            if fetcher:
+                row_df = fetcher(record_id)
+                record = row_df.iloc[0].to_dict() if not row_df.empty else None
+            else:
+                record = db_manager.get_record_by_id(table_name, record_id)
+
+        # Fall back to a full reload when the row is gone or the tree has not been laid out from DB columns yet
+        if not record or not tree.get_children() or any(col not in record for col in columns):
+            self._load_specific_table_data(table_name)
+            return
+
+        values = tuple(record[col] for col in columns)
+        item = str(record_id)
+        if tree.exists(item):
+            tree.item(item, values=values)
+        else:
+            tree.insert("", "end", iid=item, values=values)
+        self.tabs[table_name].setdefault('rows', {})[item] = values
+
     # --- Tab Creation Functions ---
     def _create_dashboard_tab(self):
         frame = ttk.Frame(self.notebook)
@@ -159,13 +422,17 @@ class DebtManagerApp(tk.Tk):
         debt_frame.pack(side='left', fill='both', expand=True, padx=(5, 0))
 
         cols = ('Date', 'Item', 'Amount')
-        self.tabs['Dashboard']['upcoming_tree'] = ttk.Treeview(upcoming_frame, columns=cols, show='headings')
+        upcoming_tree = ttk.Treeview(upcoming_frame, columns=cols, show='headings')
         for col in cols:
-            self.tabs['Dashboard']['upcoming_tree'].heading(col, text=col)
-        self.tabs['Dashboard']['upcoming_tree'].pack(fill='both', expand=True)
+            upcoming_tree.heading(col, text=col)
+        upcoming_tree.pack(fill='both', expand=True)
+        self.tabs['Dashboard']['upcoming_tree'] = upcoming_tree
 
-        self.tabs['Dashboard']['goals_frame_content'] = ttk.Frame(goals_frame)
-        self.tabs['Dashboard']['goals_frame_content'].pack(fill='both', expand=True, padx=5, pady=5)
+        goals_content = ttk.Frame(goals_frame)
+        goals_content.pack(fill='both', expand=True, padx=5, pady=5)
+        self.tabs['Dashboard']['goals_frame_content'] = goals_content
+        self.tabs['Dashboard']['goal_rows'] = [] # (frame, label, progress bar) per goal, grown as needed
+        self.tabs['Dashboard']['no_goals_label'] = ttk.Label(goals_content, text="No goals defined yet.")
 
         self.spending_fig = Figure(figsize=(5, 4), dpi=100)
         self.spending_ax = self.spending_fig.add_subplot(111)
@@ -185,13 +452,34 @@ class DebtManagerApp(tk.Tk):
         header.pack(fill='x', pady=5)
 
         ttk.Button(header, text="< Prev", command=self._calendar_prev_month).pack(side='left', padx=10)
-        self.calendar_month_label = ttk.Label(header, text="", font=('Arial', 14, 'bold'))
+        self.calendar_month_var = tk.StringVar(self)
+        self.calendar_month_label = ttk.Label(header, textvariable=self.calendar_month_var, font=('Arial', 14, 'bold'))
         self.calendar_month_label.pack(side='left', expand=True)
         ttk.Button(header, text="Next >", command=self._calendar_next_month).pack(side='right', padx=10)
 
         self.calendar_frame = ttk.Frame(frame)
         self.calendar_frame.pack(fill='both', expand=True)
 
+        # The weekday header and a 6x7 grid of day cells are built once;
+        # changing months only reconfigures their labels
+        days_of_week = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+        for i, day in enumerate(days_of_week):
+            ttk.Label(self.calendar_frame, text=day, font=('Arial', 10, 'bold')).grid(row=0, column=i, sticky='nsew')
+            self.calendar_frame.grid_columnconfigure(i, weight=1)
+
+        self.calendar_cells = []
+        for r in range(6):
+            week_cells = []
+            for c in range(7):
+                day_frame = ttk.Frame(self.calendar_frame, borderwidth=1, relief='solid')
+                day_frame.grid(row=r + 1, column=c, sticky='nsew')
+                day_label = ttk.Label(day_frame)
+                day_label.pack(anchor='nw')
+                events_label = ttk.Label(day_frame, wraplength=120, font=('Arial', 8), justify=tk.LEFT)
+                events_label.pack(anchor='w', padx=2)
+                week_cells.append((day_frame, day_label, events_label))
+            self.calendar_cells.append(week_cells)
+
     def _create_budget_tab(self):
         frame = ttk.Frame(self.notebook)
         self.tabs['Budget'] = {'frame': frame}
@@ -204,6 +492,7 @@ class DebtManagerApp(tk.Tk):
         tree = ttk.Treeview(frame, columns=cols, show='headings')
         for col in cols: tree.heading(col, text=col)
         tree.pack(fill='both', expand=True, padx=10, pady=5)
+        tree.tag_configure("red", foreground="red")
         self.tabs['Budget']['tree'] = tree
 
     def _create_analytics_tab(self):
@@ -224,8 +513,11 @@ class DebtManagerApp(tk.Tk):
         plot_frame = ttk.LabelFrame(frame, text="Balance History")
         plot_frame.pack(fill='both', expand=True, padx=10, pady=5)
 
-        self.analytics_fig = Figure(figsize=(8, 4), dpi=100)
+        # tight_layout=True lays the figure out as part of each actual draw, so updates don't run it themselves
+        self.analytics_fig = Figure(figsize=(8, 4), dpi=100, tight_layout=True)
         self.analytics_ax = self.analytics_fig.add_subplot(111)
+        # ax.clear() drops the axis formatter, so one instance is kept and reattached on each plot
+        self.history_date_formatter = mdates.DateFormatter('%Y-%m-%d')
         self.analytics_canvas = FigureCanvasTkAgg(self.analytics_fig, master=plot_frame)
         self.analytics_canvas.draw()
         self.analytics_canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
@@ -237,22 +529,26 @@ class DebtManagerApp(tk.Tk):
         report_desc = "This section allows you to export your financial data into CSV format.\n\nCSV (Comma-Separated Values) files can be opened in any spreadsheet application\n(like Microsoft Excel, Google Sheets, or LibreOffice Calc) for custom analysis, reporting, or record-keeping."
         ttk.Label(frame, text=report_desc, justify=tk.LEFT, anchor="w").pack(pady=20, padx=20)
 
-        ttk.Button(frame, text="Export All Tables to CSV", command=self._export_all_to_csv).pack(pady=10)
+        self.export_button = ttk.Button(frame, text="Export All Tables to CSV", command=self._export_all_to_csv)
+        self.export_button.pack(pady=10)
 
     def _create_data_tab(self, table_name):
-        schema = TABLE_SCHEMAS[table_name]
+        """Registers an empty frame for the table; its widgets are built the first time the tab is selected."""
         frame = ttk.Frame(self.notebook)
-        self.tabs[table_name] = {'frame': frame, 'primary_key': schema['primary_key']}
+        self.tabs[table_name] = {'frame': frame, 'primary_key': TABLE_SCHEMAS[table_name]['primary_key']}
+
+    def _build_data_tab(self, table_name):
+        frame = self.tabs[table_name]['frame']
 
         button_frame = ttk.Frame(frame)
         button_frame.pack(fill='x', padx=10, pady=5)
 
         # Add button only for tables that are meant to be added to directly
-        if table_name in ['Accounts', 'Payments', 'Goals', 'Revenue']:
+        if table_name in ADDABLE_TABLES:
              ttk.Button(button_frame, text=f"Add New {table_name[:-1]}", command=lambda t=table_name: self._open_add_edit_form(t)).pack(side='left')
 
         # Edit button for all user-editable tables
-        if table_name in ['Accounts', 'Payments', 'Debts', 'Bills', 'Goals', 'Revenue']:
+        if table_name in EDITABLE_TABLES:
              ttk.Button(button_frame, text="Edit Selected", command=lambda t=table_name: self._open_add_edit_form(t, edit_mode=True)).pack(side='left', padx=5)
 
         ttk.Button(button_frame, text="Refresh Data", command=self.load_all_data).pack(side='right')
@@ -260,7 +556,7 @@ class DebtManagerApp(tk.Tk):
         tree_frame = ttk.Frame(frame)
         tree_frame.pack(fill='both', expand=True, padx=10, pady=5)
 
-        tree = ttk.Treeview(tree_frame, columns=schema['csv_columns'], show='headings')
+        tree = ttk.Treeview(tree_frame, show='headings')
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=tree.xview)
         tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
@@ -270,155 +566,251 @@ class DebtManagerApp(tk.Tk):
         tree.pack(fill='both', expand=True)
 
         self.tabs[table_name]['tree'] = tree
+        # Plain tables come back with the schema's columns in schema order, so the first load won't
+        # relayout the headings (unless the database lacks one); joined tabs (Debts, Bills) take
+        # theirs from the first query
+        if table_name not in TABLE_FETCHERS:
+            self._set_tree_columns(table_name, tuple(COLUMN_TYPES[table_name]))
 
 
     # --- Data Loading & Form Functions ---
 
     def _load_dashboard_data(self):
+        """Runs the dashboard queries on the worker pool, then redraws the panels on the Tk thread."""
+        self._run_latest('Dashboard', _fetch_dashboard_data, lambda data: self._render_dashboard(*data))
+
+    def _render_dashboard(self, upcoming_items, goals_df, spending_df, debt_df):
         # Upcoming Items
         upcoming_tree = self.tabs['Dashboard']['upcoming_tree']
-        for i in upcoming_tree.get_children():
-            upcoming_tree.delete(i)
-        upcoming_df = db_manager.get_upcoming_items()
-        if not upcoming_df.empty:
-            for _, row in upcoming_df.iterrows():
-                upcoming_tree.insert("", "end", values=row.tolist())
-
-        # Goal Progress
-        for widget in self.tabs['Dashboard']['goals_frame_content'].winfo_children():
-            widget.destroy()
-        goals_df = db_manager.get_goal_progress()
+        if upcoming_items != self.tabs['Dashboard'].get('upcoming_rows'):
+            _clear_tree(upcoming_tree)
+            for row in upcoming_items:
+                upcoming_tree.insert("", "end", values=row)
+            self.tabs['Dashboard']['upcoming_rows'] = upcoming_items
+
+        # Goal Progress: the label/progress bar rows are reused across refreshes, only their values change
+        dashboard = self.tabs['Dashboard']
+        goals = []
         if not goals_df.empty:
-            for _, row in goals_df.iterrows():
-                goal_frame = ttk.Frame(self.tabs['Dashboard']['goals_frame_content'])
-                ttk.Label(goal_frame, text=f"{row['GoalName']}: ${row['CurrentAmount']:,.2f} / ${row['TargetAmount']:,.2f}").pack(anchor='w')
-                progress = (row['CurrentAmount'] / row['TargetAmount']) if row['TargetAmount'] > 0 else 0
-                ttk.Progressbar(goal_frame, value=progress * 100).pack(fill='x', expand=True)
+            # Labels and percentages for every goal in a few column operations
+            targets = goals_df['TargetAmount']
+            labels = (goals_df['GoalName'] + ": " + _currency_column(goals_df['CurrentAmount'])
+                      + " / " + _currency_column(targets))
+            progress = (goals_df['CurrentAmount'] / targets.where(targets > 0)).fillna(0) * 100
+            goals = list(zip(labels, progress.tolist()))
+
+        goal_rows = dashboard['goal_rows']
+        while len(goal_rows) < len(goals):
+            goal_frame = ttk.Frame(dashboard['goals_frame_content'])
+            goal_label = ttk.Label(goal_frame)
+            goal_label.pack(anchor='w')
+            goal_bar = ttk.Progressbar(goal_frame)
+            goal_bar.pack(fill='x', expand=True)
+            goal_rows.append((goal_frame, goal_label, goal_bar))
+        for i, (goal_frame, goal_label, goal_bar) in enumerate(goal_rows):
+            if i < len(goals):
+                goal_label.configure(text=goals[i][0])
+                goal_bar.configure(value=goals[i][1])
                 goal_frame.pack(fill='x', pady=2)
+            else:
+                goal_frame.pack_forget()
+        if goals:
+            dashboard['no_goals_label'].pack_forget()
         else:
-            ttk.Label(self.tabs['Dashboard']['goals_frame_content'], text="No goals defined yet.").pack()
+            dashboard['no_goals_label'].pack()
 
         # Spending Chart
-        self.spending_ax.clear()
-        spending_df = db_manager.get_spending_by_category()
         if not spending_df.empty:
-            self.spending_ax.pie(spending_df['TotalAmount'], labels=spending_df['CategoryName'], autopct='%1.1f%%', startangle=90)
-            self.spending_ax.set_title(f"Spending for {datetime.now().strftime('%B %Y')}")
+            self._draw_pie_chart('spending', self.spending_ax, self.spending_canvas,
+                                 spending_df['CategoryName'].tolist(), spending_df['TotalAmount'].tolist(),
+                                 f"Spending for {datetime.now().strftime('%B %Y')}")
         else:
-            self.spending_ax.text(0.5, 0.5, "No spending data for this month.", ha='center', va='center')
-        self.spending_canvas.draw()
+            self._draw_pie_chart('spending', self.spending_ax, self.spending_canvas, empty_text="No spending data for this month.")
 
         # Debt Chart
-        self.debt_ax.clear()
-        debt_df = db_manager.get_debt_distribution()
         if not debt_df.empty:
             # Use absolute balance for pie chart sizing
-            self.debt_ax.pie(debt_df['AbsoluteBalance'], labels=debt_df['AccountName'], autopct='%1.1f%%', startangle=90)
-            self.debt_ax.set_title("Total Debt Distribution")
+            self._draw_pie_chart('debt', self.debt_ax, self.debt_canvas,
+                                 debt_df['AccountName'].tolist(), debt_df['AbsoluteBalance'].tolist(),
+                                 "Total Debt Distribution")
         else:
-            self.debt_ax.text(0.5, 0.5, "No debt accounts found.", ha='center', va='center')
-        self.debt_canvas.draw()
+            self._draw_pie_chart('debt', self.debt_ax, self.debt_canvas, empty_text="No debt accounts found.")
+
+    def _draw_pie_chart(self, chart_name, ax, canvas, labels=(), sizes=(), title=None, empty_text=None):
+        """
+        Redraws a dashboard pie chart, or does nothing if it already shows the same data.
+        The canvas repaints via draw_idle(), so Tk renders it once when it is next idle.
+        """
+        dashboard = self.tabs['Dashboard']
+        chart_key = (tuple(labels), tuple(sizes), title, empty_text)
+        if dashboard.get(f'{chart_name}_chart') == chart_key:
+            return
+        dashboard[f'{chart_name}_chart'] = chart_key
 
+        ax.clear()
+        if sizes:
+            ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90)
+            ax.set_title(title)
+        else:
+            ax.text(0.5, 0.5, empty_text, ha='center', va='center')
+        canvas.draw_idle()
+
+
+    def _request_view_refresh(self, *views):
+        """
+        Queues the named views ('Dashboard', 'Calendar', 'Budget') for one reload once saves have been
+        quiet for VIEW_REFRESH_DELAY_MS, so a save that affects several views, or a burst of saves,
+        refresh each view only once.
+        """
+        if self._closing:
+            return # on_closing cancelled the timer; nothing may reschedule it
+        self._pending_view_refresh.update(views)
+        if self._view_refresh_handle is not None:
+            self.after_cancel(self._view_refresh_handle)
+        self._view_refresh_handle = self.after(VIEW_REFRESH_DELAY_MS, self._run_view_refresh)
+
+    def _run_view_refresh(self):
+        self._view_refresh_handle = None
+        if self._closing:
+            return
+        views, self._pending_view_refresh = self._pending_view_refresh, set()
+        # Views that are not on screen just wait for their tab to be selected
+        current_tab = self._current_tab()
+        self._stale_tabs.update(views - {current_tab})
+        if current_tab in views:
+            self._load_tab(current_tab)
 
     def _populate_calendar(self):
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
-
+        """Fetches the shown month's due dates on the worker pool, then redraws the grid."""
         year = self.current_calendar_date.year
         month = self.current_calendar_date.month
-        self.calendar_month_label.config(text=f"{calendar.month_name[month]} {year}")
-
-        events = db_manager.get_calendar_events(year, month)
+        self.calendar_month_var.set(f"{calendar.month_name[month]} {year}")
+        self._run_latest('Calendar', db_manager.get_calendar_events,
+                         lambda events: self._render_calendar(year, month, events), year, month)
 
+    def _render_calendar(self, year, month, events):
+        """Fills the prebuilt day cells for the given month; weeks the month doesn't reach are hidden."""
         cal = calendar.Calendar()
         month_days = cal.monthdayscalendar(year, month)
 
-        days_of_week = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        for i, day in enumerate(days_of_week):
-            ttk.Label(self.calendar_frame, text=day, font=('Arial', 10, 'bold')).grid(row=0, column=i, sticky='nsew')
-
-        for r, week in enumerate(month_days):
-            for c, day in enumerate(week):
-                day_frame = ttk.Frame(self.calendar_frame, borderwidth=1, relief='solid')
-                day_frame.grid(row=r + 1, column=c, sticky='nsew')
-                self.calendar_frame.grid_columnconfigure(c, weight=1)
-                self.calendar_frame.grid_rowconfigure(r + 1, weight=1)
-
-                if day != 0:
-                    lbl = ttk.Label(day_frame, text=str(day))
-                    if datetime.now().day == day and datetime.now().month == month and datetime.now().year == year:
-                        lbl.config(font=('Arial', 10, 'bold'))
-                    lbl.pack(anchor='nw')
-
-                    if day in events:
-                        for event in events[day]:
-                            event_label = ttk.Label(day_frame, text=event, wraplength=120, font=('Arial', 8))
-                            event_label.pack(anchor='w', padx=2)
+        # Day number to highlight, if today falls in the month being shown
+        today = date.today()
+        today_day = today.day if (today.year, today.month) == (year, month) else None
+
+        for r, week_cells in enumerate(self.calendar_cells):
+            shown = r < len(month_days)
+            self.calendar_frame.grid_rowconfigure(r + 1, weight=1 if shown else 0)
+            for c, (day_frame, day_label, events_label) in enumerate(week_cells):
+                if not shown:
+                    day_frame.grid_remove()
+                    continue
+                day_frame.grid()
+                day = month_days[r][c]
+                day_label.configure(text=str(day) if day else '',
+                                    font=('Arial', 10, 'bold') if day == today_day else '')
+                events_label.configure(text='\n'.join(events.get(day, ())) if day else '')
 
     def _load_budget_data(self):
-        tree = self.tabs['Budget']['tree']
-        for i in tree.get_children():
-            tree.delete(i)
+        today = date.today()
+        self._run_latest('Budget', db_manager.get_budget_summary, self._render_budget, today.year, today.month)
 
-        budget_df = db_manager.get_budget_summary(datetime.now().year, datetime.now().month)
+    def _render_budget(self, budget_df):
+        budget_tab = self.tabs['Budget']
+        tree = budget_tab['tree']
+        rows = []
         if not budget_df.empty:
-            for _, row in budget_df.iterrows():
-                remaining = row['Allocated'] - row['Actual']
-                color = "red" if remaining < 0 else "black"
-                tree.insert("", "end", values=(row['Category'], f"${row['Allocated']:,.2f}", f"${row['Actual']:,.2f}", f"${remaining:,.2f}"), tags=(color,))
-        tree.tag_configure("red", foreground="red")
+            remaining = budget_df['Allocated'] - budget_df['Actual']
+            colors = remaining.lt(0).map({True: "red", False: "black"})
+            rows = list(zip(zip(budget_df['Category'], _currency_column(budget_df['Allocated']),
+                                _currency_column(budget_df['Actual']), _currency_column(remaining)),
+                            colors))
+        # A refresh that finds the same figures leaves the tree untouched
+        if rows == budget_tab.get('rows'):
+            return
+        budget_tab['rows'] = rows
+        _clear_tree(tree)
+        for values, color in rows:
+            tree.insert("", "end", values=values, tags=(color,))
 
 
     def on_tab_change(self, event):
         selected_tab = event.widget.tab(event.widget.select(), "text")
-        if selected_tab == "Analytics":
-            self.populate_analytics_account_dropdown()
-            self._display_balance_history()
-        elif selected_tab == "Dashboard":
-             self._load_dashboard_data()
-        elif selected_tab == "Calendar":
-            self._populate_calendar()
-        elif selected_tab == "Budget":
-            self._load_budget_data()
+        if selected_tab in TABLE_SCHEMAS and 'tree' not in self.tabs[selected_tab]:
+            self._build_data_tab(selected_tab)
+            self._load_tab(selected_tab)
+        elif selected_tab == "Analytics" or selected_tab in self._stale_tabs:
+            # Analytics' picker and history are served from caches, so it is cheap to refresh every time
+            self._load_tab(selected_tab)
 
 
     def populate_analytics_account_dropdown(self):
-        accounts = db_manager.get_table_data('Accounts')
-        if not accounts.empty:
-            self.analytics_account_combo['values'] = accounts['AccountName'].tolist()
-            if not self.analytics_account_combo.get() and len(accounts['AccountName'].tolist()) > 0:
-                 self.analytics_account_combo.current(0)
+        account_names = [name for _, name in db_manager.get_combo_options('Accounts', 'AccountID', 'AccountName')]
+        if not account_names:
+            return
+        # Called on every Analytics visit; only push the list to Tk when it actually changed
+        analytics = self.tabs['Analytics']
+        if account_names != analytics.get('account_names'):
+            self.analytics_account_combo['values'] = account_names
+            analytics['account_names'] = account_names
+        if not self.analytics_account_combo.get():
+            self.analytics_account_combo.current(0)
 
 
     def _display_balance_history(self, event=None):
         account_name = self.analytics_account_combo.get()
-        self.analytics_ax.clear()
 
-        if not account_name:
-            self.analytics_ax.text(0.5, 0.5, "Select an account to view its history.", ha='center', va='center')
-            self.analytics_canvas.draw()
-            return
+        # History only changes when balances are recorded, so reuse the parsed frame until then
+        history_df = None
+        if account_name:
+            history_df = self._history_cache.get(account_name)
+            if history_df is None:
+                # Query on the worker pool and come back here once the frame is cached
+                def on_result(df):
+                    self._history_cache[account_name] = df
+                    self._display_balance_history()
+                self._run_latest('History', _fetch_balance_history, on_result, account_name)
+                return
 
-        history_df = db_manager.get_balance_history_for_account(account_name)
-
-        if not history_df.empty:
-            history_df['DateRecorded'] = pd.to_datetime(history_df['DateRecorded'])
-            self.analytics_ax.plot(history_df['DateRecorded'], history_df['Balance'], marker='o', linestyle='-')
-            self.analytics_ax.set_title(f"Balance History for {account_name}")
-            self.analytics_ax.set_xlabel("Date")
-            self.analytics_ax.set_ylabel("Balance ($)")
-            self.analytics_ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-            self.analytics_ax.tick_params(axis='x', rotation=45)
-            self.analytics_fig.tight_layout()
+        # Revisiting the tab with the same account and the same cached frame leaves the plot as drawn
+        analytics = self.tabs['Analytics']
+        shown = analytics.get('shown_history')
+        if shown and shown[0] == account_name and shown[1] is history_df:
+            return
+        analytics['shown_history'] = (account_name, history_df)
+
+        ax = self.analytics_ax
+        history_line = analytics.get('history_line')
+        if account_name and not history_df.empty:
+            if history_line is None:
+                # First plot after a message: set up the axes once
+                ax.clear()
+                history_line, = ax.plot(history_df['DateRecorded'], history_df['Balance'], marker='o', linestyle='-')
+                ax.set_xlabel("Date")
+                ax.set_ylabel("Balance ($)")
+                ax.xaxis.set_major_formatter(self.history_date_formatter)
+                ax.tick_params(axis='x', rotation=45)
+                analytics['history_line'] = history_line
+            else:
+                # Switching accounts only swaps the line's data and rescales
+                history_line.set_data(history_df['DateRecorded'], history_df['Balance'])
+                ax.relim()
+                ax.autoscale_view()
+            ax.set_title(f"Balance History for {account_name}")
         else:
-            self.analytics_ax.text(0.5, 0.5, "No balance history recorded for this account.", ha='center', va='center')
+            ax.clear()
+            analytics['history_line'] = None
+            if not account_name:
+                ax.text(0.5, 0.5, "Select an account to view its history.", ha='center', va='center')
+            else:
+                ax.text(0.5, 0.5, "No balance history recorded for this account.", ha='center', va='center')
 
-        self.analytics_canvas.draw()
+        self.analytics_canvas.draw_idle()
 
 
     def _record_balances(self):
         try:
             db_manager.record_all_account_balances()
+            self._invalidate_cache()
             messagebox.showinfo("Success", "Successfully recorded the current balance for all active accounts.")
             self._display_balance_history() # Refresh plot
         except Exception as e:
@@ -432,7 +824,7 @@ class DebtManagerApp(tk.Tk):
             self._open_goal_form(edit_mode)
         elif table_name == 'Revenue':
             self._open_revenue_form(edit_mode)
-        elif table_name in ['Debts', 'Bills']:
+        elif table_name in DETAIL_FORM_TABLES:
             self._open_details_edit_form(table_name)
         # Fallback to a generic form for other tables if needed, though most now have custom ones.
         # This part requires creating the actual form windows.
@@ -442,6 +834,25 @@ class DebtManagerApp(tk.Tk):
              # For now, we will assume specific forms cover all needed cases.
 
 
+    def _validate_fields(self, fields, data):
+        """Checks date/decimal/integer fields in one pass and reports every problem in a single dialog."""
+        errors = []
+        for field in fields:
+            value = data.get(field['name'])
+            if not value:
+                continue
+            field_type = field['type']
+            if field_type == 'date' and not _is_valid_date(value):
+                errors.append(f"{field['name']}: expected a date in YYYY-MM-DD format")
+            elif field_type == 'decimal' and not _NUM_RE.match(value):
+                errors.append(f"{field['name']}: expected a number")
+            elif field_type == 'integer' and not _INT_RE.match(value):
+                errors.append(f"{field['name']}: expected a whole number")
+        if errors:
+            messagebox.showerror("Input Error", "\n".join(errors))
+            return False
+        return True
+
     def _open_goal_form(self, edit_mode=False):
         form_window = tk.Toplevel(self)
         form_window.title(f"{'Edit' if edit_mode else 'Add'} Goal")
@@ -450,13 +861,11 @@ class DebtManagerApp(tk.Tk):
         item_id = None
 
         if edit_mode:
-            tree = self.tabs['Goals']['tree']
-            selected_item = tree.selection()
-            if not selected_item:
+            item_id = self._selected_record_id('Goals')
+            if item_id is None:
                 messagebox.showerror("Error", "Please select a goal to edit.")
                 form_window.destroy()
                 return
-            item_id = tree.item(selected_item)['values'][0]
             current_data = db_manager.get_record_by_id('Goals', item_id)
             linked_accounts = db_manager.get_linked_accounts_for_goal(item_id)
 
@@ -471,42 +880,50 @@ class DebtManagerApp(tk.Tk):
 
         # Add account linking
         ttk.Label(form_window, text="Link Accounts:").grid(row=len(fields), column=0, padx=5, pady=5, sticky='w')
-        accounts = db_manager.get_table_data('Accounts')
-        account_names = accounts['AccountName'].tolist() if not accounts.empty else []
-        account_ids = accounts['AccountID'].tolist() if not accounts.empty else []
+        account_options = db_manager.get_combo_options('Accounts', 'AccountID', 'AccountName')
+        account_ids = [acc_id for acc_id, _ in account_options]
+        account_names = [name for _, name in account_options]
 
         listbox_frame = ttk.Frame(form_window)
         listbox = tk.Listbox(listbox_frame, selectmode='multiple', exportselection=False, height=5)
-        for name in account_names:
-            listbox.insert(tk.END, name)
+        if account_names:
+            listbox.insert(tk.END, *account_names) # One Tcl call for the whole list
         listbox.pack(side='left', fill='y')
 
         if edit_mode and linked_accounts:
+            list_positions = {acc_id: idx for idx, acc_id in enumerate(account_ids)}
             for acc_id in linked_accounts:
-                try:
-                    idx = account_ids.index(acc_id)
+                idx = list_positions.get(acc_id)
+                if idx is not None: # Account might be deleted
                     listbox.selection_set(idx)
-                except ValueError:
-                    continue # Account might be deleted
 
         listbox_frame.grid(row=len(fields), column=1, padx=5, pady=5)
+        initial_state = (_read_entries(entries), listbox.curselection())
 
         def save():
-            data = {field: entries[field].get() for field in entries}
+            data = _read_entries(entries)
             selected_indices = listbox.curselection()
+            if edit_mode and (data, selected_indices) == initial_state:
+                form_window.destroy() # Nothing was edited; skip the write and the refreshes
+                return
             linked_account_ids = [account_ids[i] for i in selected_indices]
 
             if not all([data['GoalName'], data['TargetAmount']]):
                 messagebox.showerror("Error", "Goal Name and Target Amount are required.")
                 return
+            if not self._validate_fields(fields, data):
+                return
 
             try:
                 if edit_mode:
                     db_manager.update_goal(item_id, data, linked_account_ids)
+                    goal_id = item_id
                 else:
-                    db_manager.add_goal(data, linked_account_ids)
+                    goal_id = db_manager.add_goal(data, linked_account_ids)
 
-                self.load_all_data()
+                # Only the edited row and the goal progress panel depend on this change
+                self._load_specific_table_data('Goals', changed_pks=[goal_id])
+                self._request_view_refresh('Dashboard')
                 form_window.destroy()
             except Exception as e:
                 messagebox.showerror("Database Error", f"Could not save goal: {e}")
@@ -522,17 +939,16 @@ class DebtManagerApp(tk.Tk):
         item_id = None
 
         if edit_mode:
-            tree = self.tabs['Revenue']['tree']
-            selected_item = tree.selection()
-            if not selected_item:
+            item_id = self._selected_record_id('Revenue')
+            if item_id is None:
                 messagebox.showerror("Error", "Please select a revenue item to edit.")
                 form_window.destroy()
                 return
-            item_id = tree.item(selected_item)['values'][0]
             current_data = db_manager.get_record_by_id('Revenue', item_id)
-            allocations = json.loads(current_data.get('Allocations', '{}')) if current_data else {}
+            # Parsed once per form; a NULL or empty Allocations column means no allocations
+            allocations = json.loads(current_data.get('Allocations') or '{}') if current_data else {}
 
-        fields = [f for f in TABLE_SCHEMAS['Revenue']['gui_fields'] if f['type'] != 'allocations']
+        fields = REVENUE_FORM_FIELDS
         for i, field in enumerate(fields):
             ttk.Label(form_window, text=field['name']).grid(row=i, column=0, padx=5, pady=5, sticky='w')
             entry = ttk.Entry(form_window, width=40)
@@ -545,35 +961,45 @@ class DebtManagerApp(tk.Tk):
         alloc_frame = ttk.LabelFrame(form_window, text="Allocations (%)")
         alloc_frame.grid(row=len(fields), columnspan=2, padx=5, pady=5, sticky='ew')
 
-        accounts = db_manager.get_table_data('Accounts')
         alloc_entries = {}
-        if not accounts.empty:
-            for i, row in accounts.iterrows():
-                acc_id, acc_name = str(row['AccountID']), row['AccountName']
-                ttk.Label(alloc_frame, text=acc_name).grid(row=i, column=0, sticky='w')
-                alloc_entry = ttk.Entry(alloc_frame, width=10)
-                alloc_entry.grid(row=i, column=1, sticky='e')
-                if edit_mode and acc_id in allocations:
-                    alloc_entry.insert(0, allocations[acc_id])
-                alloc_entries[acc_id] = alloc_entry
+        for i, (acc_id, acc_name) in enumerate(db_manager.get_combo_options('Accounts', 'AccountID', 'AccountName')):
+            acc_id = str(acc_id) # Allocation keys are stored as strings in the JSON blob
+            ttk.Label(alloc_frame, text=acc_name).grid(row=i, column=0, sticky='w')
+            alloc_entry = ttk.Entry(alloc_frame, width=10)
+            alloc_entry.grid(row=i, column=1, sticky='e')
+            percent = allocations.get(acc_id) if edit_mode else None
+            if percent is not None:
+                alloc_entry.insert(0, percent)
+            alloc_entries[acc_id] = alloc_entry
+
+        initial_state = (_read_entries(entries),
+                         _read_entries(alloc_entries))
 
         def save():
-            data = {field: entries[field].get() for field in entries}
+            data = _read_entries(entries)
+            alloc_values = _read_entries(alloc_entries)
+            if edit_mode and (data, alloc_values) == initial_state:
+                form_window.destroy() # Nothing was edited; skip the write and the refreshes
+                return
 
             # Process allocations
             new_allocations = {}
             total_percent = 0
-            for acc_id, entry in alloc_entries.items():
-                percent_str = entry.get()
-                if percent_str:
-                    try:
-                        percent = float(percent_str)
-                        if percent > 0:
-                            new_allocations[acc_id] = percent
-                            total_percent += percent
-                    except ValueError:
-                        messagebox.showerror("Error", f"Invalid percentage for account ID {acc_id}.")
-                        return
+            invalid_ids = []
+            for acc_id, percent_str in alloc_values.items():
+                if not percent_str:
+                    continue
+                if not _NUM_RE.match(percent_str):
+                    invalid_ids.append(acc_id)
+                    continue
+                percent = float(percent_str)
+                if percent > 0:
+                    new_allocations[acc_id] = percent
+                    total_percent += percent
+
+            if invalid_ids:
+                messagebox.showerror("Error", f"Invalid percentage for account ID(s): {', '.join(invalid_ids)}.")
+                return
 
             if new_allocations and round(total_percent) != 100:
                 messagebox.showerror("Error", f"Allocation percentages must sum to 100. Current sum: {total_percent}%")
@@ -584,14 +1010,18 @@ class DebtManagerApp(tk.Tk):
             if not all([data['SourceName'], data['Amount'], data['DateReceived']]):
                 messagebox.showerror("Error", "Source Name, Amount, and Date Received are required.")
                 return
+            if not self._validate_fields(fields, data):
+                return
 
             try:
                 if edit_mode:
                     db_manager.update_record('Revenue', item_id, data)
+                    revenue_id = item_id
                 else:
-                    db_manager.add_record('Revenue', data)
+                    revenue_id = db_manager.add_record('Revenue', data)
 
-                self.load_all_data()
+                # Revenue is not shown on any other tab, so just patch the affected row
+                self._load_specific_table_data('Revenue', changed_pks=[revenue_id])
                 form_window.destroy()
             except Exception as e:
                 messagebox.showerror("Database Error", f"Could not save revenue: {e}")
@@ -600,16 +1030,14 @@ class DebtManagerApp(tk.Tk):
 
 
     def _open_details_edit_form(self, table_name):
-        tree = self.tabs[table_name]['tree']
-        selected_item = tree.selection()
-        if not selected_item:
+        item_id = self._selected_record_id(table_name)
+        if item_id is None:
             messagebox.showerror("Error", f"Please select an item from the '{table_name}' tab to edit.")
             return
 
         form_window = tk.Toplevel(self)
         form_window.title(f"Edit {table_name[:-1]} Details")
 
-        item_id = tree.item(selected_item)['values'][0]
         current_data = db_manager.get_record_by_id(table_name, item_id)
 
         if not current_data:
@@ -626,14 +1054,26 @@ class DebtManagerApp(tk.Tk):
             entry.insert(0, current_data.get(field['name'], ''))
             entries[field['name']] = entry
 
+        initial_values = _read_entries(entries)
+
         def save():
-            detail_data = {field: entries[field].get() for field in entries}
+            detail_data = _read_entries(entries)
+            if detail_data == initial_values:
+                form_window.destroy() # Nothing was edited; skip the write and the refreshes
+                return
+            if not self._validate_fields(fields, detail_data):
+                return
             try:
                 if table_name == 'Debts':
                     db_manager.update_debt_details(item_id, detail_data)
                 elif table_name == 'Bills':
                     db_manager.update_bill_details(item_id, detail_data)
-                self.load_all_data()
+                # Patch the edited row, then refresh only the views that display one of the edited fields
+                self._load_specific_table_data(table_name, changed_pks=[item_id])
+                changed = {field for field, value in detail_data.items() if value != initial_values[field]}
+                views = [view for view, view_fields in DETAIL_VIEW_FIELDS[table_name].items() if changed & view_fields]
+                if views:
+                    self._request_view_refresh(*views)
                 form_window.destroy()
             except Exception as e:
                 messagebox.showerror("Save Error", f"Failed to save details: {e}")
@@ -648,8 +1088,8 @@ class DebtManagerApp(tk.Tk):
         categories = db_manager.get_budget_categories()
         current_budgets = db_manager.get_all_budgets() # Returns a dict {CategoryID: AllocatedAmount}
 
-        for i, cat in categories.iterrows():
-            cat_id, cat_name = cat['CategoryID'], cat['CategoryName']
+        category_pairs = zip(categories['CategoryID'].tolist(), categories['CategoryName']) if not categories.empty else ()
+        for i, (cat_id, cat_name) in enumerate(category_pairs):
             ttk.Label(form, text=cat_name).grid(row=i, column=0, padx=5, pady=2, sticky='w')
             entry = ttk.Entry(form, width=15)
             entry.grid(row=i, column=1, padx=5, pady=2)
@@ -658,55 +1098,139 @@ class DebtManagerApp(tk.Tk):
             entries[cat_id] = entry
 
         def save_budgets():
-            for cat_id, entry in entries.items():
-                amount_str = entry.get()
-                if amount_str:
-                    try:
-                        amount = float(amount_str)
-                        db_manager.set_budget_for_category(cat_id, amount)
-                    except ValueError:
-                        messagebox.showwarning("Input Error", f"Invalid amount for category ID {cat_id}. Skipping.")
+            # Validate every entry first, then write all valid amounts in one batch
+            budgets, invalid_ids = [], []
+            for cat_id, amount_str in _read_entries(entries).items():
+                if not amount_str:
+                    continue
+                if not _NUM_RE.match(amount_str):
+                    invalid_ids.append(str(cat_id))
+                    continue
+                budgets.append((cat_id, float(amount_str)))
+            try:
+                db_manager.set_budgets_bulk(budgets)
+            except Exception as e:
+                messagebox.showerror("Database Error", f"Could not save budgets: {e}")
+                return
+
+            if invalid_ids:
+                messagebox.showwarning("Input Error", f"Invalid amount for category ID(s) {', '.join(invalid_ids)}. Skipped.")
 
             messagebox.showinfo("Success", "Budgets have been updated.")
-            self._load_budget_data()
+            self._request_view_refresh('Budget')
             form.destroy()
 
         ttk.Button(form, text="Save All", command=save_budgets).grid(row=len(categories), columnspan=2, pady=10)
 
 
     def _calendar_prev_month(self):
-        self.current_calendar_date = self.current_calendar_date.replace(day=1) - timedelta(days=1)
+        year, month = self.current_calendar_date.year, self.current_calendar_date.month
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+        self.current_calendar_date = date(year, month, 1)
         self._populate_calendar()
 
     def _calendar_next_month(self):
-        self.current_calendar_date = (self.current_calendar_date.replace(day=28) + timedelta(days=4)).replace(day=1)
+        year, month = self.current_calendar_date.year, self.current_calendar_date.month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        self.current_calendar_date = date(year, month, 1)
         self._populate_calendar()
 
+    def _run_in_background(self, func, on_done, *args, pool=None):
+        """
+        Runs func(*args) on a worker pool (the query pool unless another is given)
+        and calls on_done(future) back on the Tk thread.
+        """
+        if self._closing and pool is None:
+            return None # The query pool is shut down; nothing may be queued on it any more
+        future = (pool or self._query_pool).submit(func, *args)
+
+        def poll():
+            if future.cancelled():
+                return # Dropped by on_closing; nothing is waiting for it
+            if future.done():
+                on_done(future)
+            else:
+                self.after(BACKGROUND_POLL_MS, poll)
+
+        self.after(BACKGROUND_POLL_MS, poll)
+        return future
+
+    def _run_latest(self, key, func, on_result, *args):
+        """
+        Like _run_in_background, but only the newest request per key delivers its result:
+        on_result(value) runs on the Tk thread unless a later request for the same key superseded it.
+        Failures are logged.
+        """
+        seq = self._latest_request[key] = self._latest_request.get(key, 0) + 1
+
+        def on_done(future):
+            if self._latest_request.get(key) != seq:
+                return
+            try:
+                result = future.result()
+            except Exception as e:
+                logging.error(f"Error loading {key} data: {e}", exc_info=True)
+                return
+            on_result(result)
+
+        return self._run_in_background(func, on_done, *args)
+
     def _export_all_to_csv(self):
-        try:
-            sqlite_to_csv()
-            messagebox.showinfo("Export Success", f"All tables have been successfully exported to CSV files in:\n{os.path.join(BASE_DIR, 'csv_data')}")
-        except Exception as e:
-            messagebox.showerror("Export Error", f"An error occurred during the CSV export: {e}")
+        self.export_button.state(['disabled'])
+        export_version = db_manager.data_version()
 
-    def on_closing(self):
-        if messagebox.askokcancel("Quit", "Do you want to quit? Your latest data will be synced to CSV files."):
+        def on_done(future):
+            self.export_button.state(['!disabled'])
+            if self._closing:
+                return # The window is already hidden; the final sync on closing reports to the log
             try:
-                sqlite_to_csv()
-                logging.info("Data successfully synced to CSV on closing.")
+                future.result()
+                self._csv_synced_version = export_version
+                messagebox.showinfo("Export Success", f"All tables have been successfully exported to CSV files in:\n{CSV_DIR}")
             except Exception as e:
-                logging.error(f"Failed to sync data to CSV on closing: {e}")
-            self.destroy()
+                messagebox.showerror("Export Error", f"An error occurred during the CSV export: {e}")
 
-if __name__ == "__main__":
-    from debt_manager_db_init import initialize_database
-    from debt_manager_sample_data import populate_with_sample_data
+        self._run_in_background(sqlite_to_csv, on_done, pool=self._io_pool)
 
-    # Ensure database and sample data exist for a good first run experience
-    initialize_database()
-    accounts_df = db_manager.get_table_data('Accounts')
-    if accounts_df.empty:
-        populate_with_sample_data()
+    def on_closing(self):
+        if messagebox.askokcancel("Quit", "Do you want to quit? Your latest data will be synced to CSV files."):
+            # Pending tab loads and view refreshes are no longer needed
+            self._closing = True
+            if self._view_refresh_handle is not None:
+                self.after_cancel(self._view_refresh_handle)
+                self._view_refresh_handle = None
+            self._pending_view_refresh.clear()
+            self._query_pool.shutdown(wait=False, cancel_futures=True)
+            if db_manager.data_version() == self._csv_synced_version:
+                logging.info("No changes since the last CSV sync; skipping sync on closing.")
+                self._finish_closing()
+                return
+
+            # Hide the window right away and sync on the export worker, queued behind any export
+            # still running so both never write the same files at once
+            self.withdraw()
+
+            def on_done(future):
+                try:
+                    future.result()
+                    logging.info("Data successfully synced to CSV on closing.")
+                except Exception as e:
+                    logging.error(f"Failed to sync data to CSV on closing: {e}")
+                self._finish_closing()
 
-    app = DebtManagerApp()
-    app.mainloop()
\ No newline at end of file
+            self._run_in_background(sqlite_to_csv, on_done, pool=self._io_pool)
+
+    def _finish_closing(self):
+        self._io_pool.shutdown(wait=True)
+        db_manager.close_thread_connection()
+        self.destroy()
+
+if __name__ == "__main__":
+    _prepare_database()
+
+    log_listener = _start_log_listener()
+    try:
+        app = DebtManagerApp()
+        app.mainloop()
+    finally:
+        log_listener.stop() # Flushes whatever is still queued, e.g. the closing sync's messages
@@ -10,13 +10,10 @@
 import os
 import subprocess
 import logging
-import time
 import sys
 
 # Define paths to other scripts and the CSV directory
 BASE_DIR = 'C:\\DebtTracker'
-DB_INIT_SCRIPT = os.path.join(BASE_DIR, 'debt_manager_db_init.py')
-CSV_SYNC_SCRIPT = os.path.join(BASE_DIR, 'debt_manager_csv_sync.py')
 UI_SCRIPT = os.path.join(BASE_DIR, 'debt_manager_gui.py')
 LOG_DIR = os.path.join(BASE_DIR, 'Logs')
 LOG_FILE = os.path.join(LOG_DIR, 'OrchestratorLog.txt')
@@ -34,26 +31,6 @@ logging.basicConfig(level=logging.INFO,
                         logging.StreamHandler()
                     ])
 
-def run_python_script(script_path, script_name):
-    """Helper function to run a Python script as a subprocess."""
-    logging.info(f"Running Python script: {script_name} from {script_path}")
-    if not os.path.exists(script_path):
-        logging.error(f"Error: {script_name} not found at {script_path}")
-        raise FileNotFoundError(f"{script_name} not found.")
-
-    try:
-        result = subprocess.run([PYTHON_EXECUTABLE, script_path], check=True, capture_output=True, text=True)
-        logging.info(f"{script_name} stdout:\n{result.stdout}")
-        if result.stderr:
-            logging.warning(f"{script_name} stderr:\n{result.stderr}")
-        logging.info(f"{script_name} completed successfully.")
-    except subprocess.CalledProcessError as e:
-        logging.error(f"Error running {script_name} (Exit Code: {e.returncode}): {e.stderr}", exc_info=True)
-        raise
-    except Exception as e:
-        logging.error(f"Unexpected error running {script_name}: {e}", exc_info=True)
-        raise
-
 def run_python_gui_script(script_path, script_name):
     """
     Helper function to launch a Python GUI script in a non-blocking way.
@@ -67,8 +44,6 @@ def run_python_gui_script(script_path, script_name):
     try:
         subprocess.Popen([PYTHON_EXECUTABLE, script_path])
         logging.info(f"{script_name} launched (potentially with a new console window).")
-        time.sleep(0.5)
-
     except Exception as e:
         logging.critical(f"CRITICAL ERROR: Failed to launch GUI script {script_name}: {e}", exc_info=True)
         raise
@@ -78,15 +53,24 @@ def main():
     logging.info("--- Starting Debt Management System Orchestrator ---")
 
     try:
+        # Steps 1 and 2 run in this interpreter rather than as child processes. Imported here, after
+        # logging is configured above, so the modules log to the orchestrator's handlers.
+        from debt_manager_db_init import initialize_database
+        from debt_manager_csv_sync import sqlite_to_csv, csv_is_current
+
         # Step 1: Initialize Database
         logging.info("Step 1: Initializing database...")
-        run_python_script(DB_INIT_SCRIPT, 'debt_manager_db_init.py')
+        initialize_database()
         logging.info("Step 1: Database initialized successfully.")
 
-        # Step 2: Perform Initial SQLite to CSV Sync
-        logging.info("Step 2: Performing initial SQLite to CSV sync...")
-        run_python_script(CSV_SYNC_SCRIPT, 'debt_manager_csv_sync.py')
-        logging.info("Step 2: Initial SQLite to CSV sync completed successfully.")
+        # Step 2: Perform Initial SQLite to CSV Sync (skipped when the CSVs are newer than the database,
+        # e.g. after a session that was read-only or already synced on closing)
+        if csv_is_current():
+            logging.info("Step 2: CSV files are up to date with the database; skipping initial sync.")
+        else:
+            logging.info("Step 2: Performing initial SQLite to CSV sync...")
+            sqlite_to_csv()
+            logging.info("Step 2: Initial SQLite to CSV sync completed successfully.")
 
         # Step 3: Launch Main UI Script (Python GUI)
         logging.info("Step 3: Launching Debt Management System GUI...")
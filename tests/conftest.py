@@ -0,0 +1,36 @@
+# conftest.py
+# Purpose: Shared fixtures for the test suite; every test gets its own scratch database and CSV directory.
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The modules log to 'C:\DebtTracker\Logs', which is a relative path off Windows; run from a scratch
+# directory so importing them never creates that directory inside the checkout
+os.chdir(tempfile.mkdtemp(prefix='debttracker-tests-'))
+
+import debt_manager_db_manager as db_manager
+import debt_manager_db_init as db_init
+import debt_manager_csv_sync as csv_sync
+from config import TABLE_SCHEMAS
+
+@pytest.fixture
+def scratch_db(tmp_path, monkeypatch):
+    """Points the database and CSV paths of every module at tmp_path and returns the database path."""
+    db_dir = tmp_path / 'db'
+    csv_dir = tmp_path / 'csv_data'
+    db_path = str(db_dir / 'debt_manager.db')
+    for module in (db_manager, db_init, csv_sync):
+        monkeypatch.setattr(module, 'DB_PATH', db_path)
+    monkeypatch.setattr(db_init, 'DB_DIR', str(db_dir))
+    monkeypatch.setattr(csv_sync, 'CSV_DIR', str(csv_dir))
+    monkeypatch.setattr(csv_sync, 'CSV_FILE_PATHS',
+                        {table_name: str(csv_dir / f"{table_name}.csv") for table_name in TABLE_SCHEMAS})
+    db_manager._combo_cache.clear()
+    db_manager.close_thread_connection()
+    yield db_path
+    db_manager.close_thread_connection()
@@ -0,0 +1,69 @@
+import io
+
+import pandas as pd
+import pytest
+
+import debt_manager_db_manager as db_manager
+import debt_manager_csv_sync as csv_sync
+from config import TABLE_SCHEMAS
+from debt_manager_db_init import initialize_database
+from debt_manager_csv_sync import sqlite_to_csv, csv_is_current
+
+def test_csv_is_current_with_open_connection(scratch_db):
+    initialize_database()
+    sqlite_to_csv()
+    # Any read opens this thread's connection, which leaves an empty -wal behind
+    db_manager.table_is_empty('Accounts')
+    assert csv_is_current()
+
+    db_manager.execute_query("INSERT INTO Categories (CategoryName) VALUES (?)", ('Pets',), commit=True)
+    assert not csv_is_current()
+
+def test_startup_skips_closing_sync_when_csv_is_current(scratch_db, monkeypatch):
+    pytest.importorskip('matplotlib')
+    gui = pytest.importorskip('debt_manager_gui')
+
+    # Orchestrator: initialize, seed and sync, then hand over to the GUI process
+    initialize_database()
+    from debt_manager_sample_data import populate_with_sample_data
+    populate_with_sample_data()
+    sqlite_to_csv()
+    db_manager.close_thread_connection()
+
+    # GUI startup, then quitting without any edits
+    gui._prepare_database()
+    app = gui.DebtManagerApp.__new__(gui.DebtManagerApp) # No display needed: on_closing only uses this state
+    app._csv_synced_version = gui._startup_csv_version()
+    app._closing = False
+    app._view_refresh_handle = None
+    app._pending_view_refresh = set()
+    app._query_pool = gui.ThreadPoolExecutor(max_workers=1)
+    calls = []
+    app._finish_closing = lambda: calls.append('finish')
+    app._run_in_background = lambda *args, **kwargs: calls.append('sync')
+    app.withdraw = lambda: calls.append('withdraw')
+    monkeypatch.setattr(gui.messagebox, 'askokcancel', lambda *args: True)
+
+    app.on_closing()
+    assert calls == ['finish']
+
+def test_missing_table_exports_headers_only(scratch_db):
+    initialize_database()
+    db_manager.execute_query("DROP TABLE Revenue", commit=True)
+    sqlite_to_csv()
+    with open(csv_sync.CSV_FILE_PATHS['Revenue'], encoding='utf-8') as fh:
+        assert fh.read().splitlines() == [','.join(TABLE_SCHEMAS['Revenue']['csv_columns'])]
+
+def _write_csv(df):
+    """The text _export_table would write for df."""
+    text = csv_sync._format_csv_fast(df)
+    return text if text is not None else df.to_csv(index=False)
+
+@pytest.mark.parametrize('df', [
+    pd.DataFrame({'Notes': ['first', '', 'last']}),
+    pd.DataFrame({'ID': [1, 2, 3], 'Notes': ['first', '', 'last'], 'Amount': [1.5, 2.0, -3.25]}),
+])
+def test_csv_text_round_trips(df):
+    text = _write_csv(df)
+    assert text == df.to_csv(index=False)
+    pd.testing.assert_frame_equal(pd.read_csv(io.StringIO(text), keep_default_na=False), df, check_dtype=False)
@@ -0,0 +1,35 @@
+import sqlite3
+
+import pytest
+
+import debt_manager_db_manager as db_manager
+from debt_manager_db_init import initialize_database
+
+@pytest.fixture
+def db(scratch_db):
+    initialize_database()
+    return scratch_db
+
+def test_execute_query_returns_none_on_error_outside_transaction(db):
+    assert db_manager.add_record('Goals', {'GoalName': None, 'TargetAmount': 1}) is None
+
+def test_add_goal_raises_and_rolls_back_on_error(db):
+    account_id = db_manager.add_account_and_details({'AccountName': 'Savings', 'AccountType': 'Savings', 'Balance': 10})
+    with pytest.raises(sqlite3.IntegrityError):
+        db_manager.add_goal({'GoalName': None, 'TargetAmount': 1}, [account_id])
+    assert db_manager.table_is_empty('Goals')
+    assert db_manager.table_is_empty('GoalAccountLinks')
+
+def test_combo_options_drop_rows_of_a_rolled_back_transaction(db):
+    with pytest.raises(RuntimeError):
+        with db_manager.transaction():
+            db_manager.add_record('Categories', {'CategoryName': 'Pets'})
+            assert 'Pets' in db_manager.get_category_map() # Cached while the row is uncommitted
+            raise RuntimeError("abort")
+    assert 'Pets' not in db_manager.get_category_map()
+
+def test_missing_table_reads_as_no_data(db):
+    columns = db_manager.existing_columns('NoSuchTable', ['ID', 'Name'])
+    assert columns == []
+    assert db_manager.get_table_data('NoSuchTable', columns).empty
+    assert db_manager.get_table_rows('NoSuchTable', columns) == []